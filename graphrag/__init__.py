@@ -5,6 +5,6 @@ retrieval-augmented generation pipeline suitable for learning.
 """
 
 from .pipeline import GraphRAGPipeline
-from .visualization import VisualisationConfig, draw_graph
+from .visualization import VisualisationConfig, draw_graph, draw_graph_svg
 
-__all__ = ["GraphRAGPipeline", "VisualisationConfig", "draw_graph"]
+__all__ = ["GraphRAGPipeline", "VisualisationConfig", "draw_graph", "draw_graph_svg"]
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List
+import sys
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Iterable, List, Tuple
 
 from .data_loader import Document
+from .tokenization import find_entity_spans, tokenize
 
 
 @dataclass
 class Chunk:
-    """Atomic unit that the graph ingests."""
+    """Atomic unit that the graph ingests.
+
+    ``tokens`` and ``entity_spans`` are derived from ``text`` once on
+    construction so downstream stages never re-run the regexes.
+    """
 
     chunk_id: str
     doc_id: str
     text: str
+    tokens: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+    entity_spans: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.tokens:
+            self.tokens = tuple(tokenize(self.text))
+        if not self.entity_spans:
+            self.entity_spans = tuple(find_entity_spans(self.text))
 
 
 def chunk_document(
@@ -29,16 +44,18 @@ def chunk_document(
     """
 
     tokens = document.body.split()
+    n = len(tokens)
+    doc_id = document.doc_id
+    prefix = f"{doc_id}::chunk-"
     chunks: List[Chunk] = []
     start = 0
     idx = 0
-    while start < len(tokens):
-        end = min(len(tokens), start + max_tokens)
-        chunk_tokens = tokens[start:end]
-        text = " ".join(chunk_tokens)
-        chunk_id = f"{document.doc_id}::chunk-{idx}"
-        chunks.append(Chunk(chunk_id=chunk_id, doc_id=document.doc_id, text=text))
-        if end == len(tokens):
+    while start < n:
+        end = start + max_tokens if start + max_tokens < n else n
+        text = " ".join(tokens[start:end])
+        chunk_id = sys.intern(prefix + str(idx))
+        chunks.append(Chunk(chunk_id=chunk_id, doc_id=doc_id, text=text))
+        if end == n:
             break
         start = end - overlap
         idx += 1
@@ -47,7 +64,4 @@ def chunk_document(
 
 def chunk_corpus(documents: Iterable[Document]) -> List[Chunk]:
     """Chunk every document in ``documents``."""
-    all_chunks: List[Chunk] = []
-    for doc in documents:
-        all_chunks.extend(chunk_document(doc))
-    return all_chunks
+    return list(chain.from_iterable(chunk_document(doc) for doc in documents))
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 
 SUPPORTED_EXTENSIONS = {".txt", ".md"}
@@ -19,15 +20,38 @@ class Document:
     body: str
 
 
-def iter_documents(path: Path) -> Iterable[Document]:
-    """Yield documents from ``path`` (file or directory)."""
+def iter_source_files(path: Path) -> Iterator[Path]:
+    """Yield the files under ``path`` that :func:`iter_documents` would load.
+
+    Directories are walked depth-first with ``os.scandir``, whose entries
+    already know their type, so only matching files cost a ``stat``. Each
+    directory's files come before its subdirectories, both in name order;
+    symlinked directories are not followed and unreadable ones are skipped.
+    """
     if path.is_file():
-        yield _load_file(path)
+        yield path
         return
 
-    for file_path in sorted(path.rglob("*")):
-        if file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-            yield _load_file(file_path)
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as scan:
+                entries = sorted(scan, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS and entry.is_file():
+                yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+def iter_documents(path: Path) -> Iterable[Document]:
+    """Yield documents from ``path`` (file or directory)."""
+    for file_path in iter_source_files(path):
+        yield _load_file(file_path)
 
 
 def load_documents(path: Path) -> List[Document]:
@@ -35,7 +59,13 @@ def load_documents(path: Path) -> List[Document]:
     return list(iter_documents(path))
 
 
+def load_files(files: Iterable[Path]) -> List[Document]:
+    """Return one document per path in ``files``, e.g. from :func:`iter_source_files`."""
+    return [_load_file(file_path) for file_path in files]
+
+
 def _load_file(path: Path) -> Document:
-    text = path.read_text(encoding="utf-8")
+    with open(path, "rb") as handle:
+        text = handle.read().decode("utf-8", "replace")
     title = path.stem.replace("_", " ").title()
     return Document(doc_id=str(path), title=title, body=text)
@@ -2,76 +2,238 @@
 
 from __future__ import annotations
 
-import math
-import re
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
 
 from .chunker import Chunk
+# TOKEN_PATTERN and tokenize lived here before tokenization.py; re-exported for old imports.
+from .tokenization import TOKEN_PATTERN, tokenize  # noqa: F401
 
 
-TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Raw text, or tokens already produced by ``tokenize`` (e.g. ``Chunk.tokens``).
+TextOrTokens = Union[str, Sequence[str]]
 
 
-def tokenize(text: str) -> List[str]:
-    return TOKEN_PATTERN.findall(text.lower())
+def _as_tokens(text: TextOrTokens) -> Sequence[str]:
+    return tokenize(text) if isinstance(text, str) else text
 
 
 @dataclass
-class Embedding:
-    key: str
-    vector: List[float]
+class EmbeddingStore:
+    """Embeddings laid out as one matrix plus parallel id bookkeeping.
 
+    Row ``i`` of ``matrix`` is the vector for ``ids[i]``; ``id_to_row``
+    inverts that mapping.
+    """
+
+    ids: List[str]
+    matrix: sp.csr_matrix
+    id_to_row: Dict[str, int]
 
-class BagOfWordsEmbedder:
-    """A TF-IDF-like embedder implemented without external dependencies."""
 
-    def __init__(self):
+class BagOfWordsEmbedder:
+    """A TF-IDF-like embedder backed by NumPy/SciPy sparse matrices.
+
+    Args:
+        min_df: Drop tokens found in fewer documents than this. An ``int``
+            is a document count, a ``float`` a fraction of the corpus.
+        max_df: Drop tokens found in more documents than this (same
+            ``int``/``float`` convention), e.g. ``0.95`` for near-stopwords.
+        max_features: Keep at most this many tokens, preferring the highest
+            document frequency; ``None`` keeps them all.
+        sublinear_tf: Weight term counts as ``1 + log(count)`` instead of
+            the default augmented ``0.5 + 0.5 * count / max_count``.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_df: Union[int, float] = 1,
+        max_df: Union[int, float] = 1.0,
+        max_features: Optional[int] = 10_000,
+        sublinear_tf: bool = False,
+    ):
+        # A count and a fraction are only comparable once the corpus size is
+        # known; if they conflict then, no token survives.
+        if isinstance(min_df, int) == isinstance(max_df, int) and max_df < min_df:
+            raise ValueError("max_df corresponds to fewer documents than min_df.")
+        self.min_df = min_df
+        self.max_df = max_df
+        self.max_features = max_features
+        self.sublinear_tf = sublinear_tf
         self.vocabulary: Dict[str, int] = {}
-        self.idf: List[float] = []
-
-    def fit(self, documents: Iterable[str]) -> None:
-        doc_tokens = [set(tokenize(doc)) for doc in documents]
-        vocab = sorted({token for tokens in doc_tokens for token in tokens})
-        self.vocabulary = {token: idx for idx, token in enumerate(vocab)}
-
-        doc_count = len(doc_tokens)
-        self.idf = []
-        for token in vocab:
-            containing = sum(1 for tokens in doc_tokens if token in tokens)
-            # add-one smoothing
-            score = math.log(1 + doc_count / (1 + containing))
-            self.idf.append(score)
-
-    def transform(self, text: str) -> List[float]:
-        if not self.vocabulary:
+        # None until fit(); the vocabulary alone cannot tell, as it may be empty.
+        self.idf: Optional[np.ndarray] = None
+
+    def fit(self, documents: Iterable[TextOrTokens]) -> None:
+        vocabulary: Dict[str, int] = {}
+        # One id per (document, distinct token) pair, so a bincount is the DF.
+        present: List[int] = []
+        doc_count = 0
+        for doc in documents:
+            present.extend(
+                vocabulary.setdefault(token, len(vocabulary))
+                for token in dict.fromkeys(_as_tokens(doc))
+            )
+            doc_count += 1
+
+        df = np.bincount(np.asarray(present, dtype=np.intp), minlength=len(vocabulary))
+        keep = self._select_features(df, doc_count)
+        tokens = list(vocabulary)
+        self.vocabulary = {tokens[old_id]: new_id for new_id, old_id in enumerate(keep)}
+        # add-one smoothing
+        self.idf = np.log1p(doc_count / (1 + df[keep]))
+
+    def transform(self, text: TextOrTokens) -> np.ndarray:
+        """Return the dense TF-IDF vector for ``text``."""
+        ids, weights = self._weigh(_as_tokens(text))
+        vector = np.zeros(len(self.vocabulary), dtype=np.float64)
+        vector[ids] = weights
+        return vector
+
+    def transform_many(
+        self,
+        texts: Iterable[TextOrTokens],
+        *,
+        jobs: Optional[int] = 1,
+        batch_size: int = 512,
+    ) -> sp.csr_matrix:
+        """Return a sparse matrix with one TF-IDF row per text.
+
+        Args:
+            texts: Raw strings or pre-tokenised sequences.
+            jobs: Worker processes to spread batches over; ``None`` uses
+                every CPU. Inputs that fit in one batch are always
+                transformed in-process.
+            batch_size: Texts handed to a worker at a time.
+        """
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1:
+            texts = list(texts)
+            if len(texts) > batch_size:
+                return self._transform_parallel(texts, jobs, batch_size)
+
+        data: List[np.ndarray] = []
+        indices: List[np.ndarray] = []
+        indptr = [0]
+        for text in texts:
+            ids, weights = self._weigh(_as_tokens(text))
+            indices.append(ids)
+            data.append(weights)
+            indptr.append(indptr[-1] + ids.size)
+        return sp.csr_matrix(
+            (
+                np.concatenate(data).astype(np.float32) if data else np.zeros(0, dtype=np.float32),
+                np.concatenate(indices) if indices else np.zeros(0, dtype=np.intp),
+                indptr,
+            ),
+            shape=(len(indptr) - 1, len(self.vocabulary)),
+        )
+
+    def fit_transform_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        *,
+        jobs: Optional[int] = 1,
+        batch_size: int = 512,
+    ) -> EmbeddingStore:
+        """Fit on ``chunks`` and return their TF-IDF rows keyed by chunk_id."""
+        chunk_list = list(chunks)
+        self.fit(chunk.tokens for chunk in chunk_list)
+        matrix = self.transform_many(
+            (chunk.tokens for chunk in chunk_list), jobs=jobs, batch_size=batch_size
+        )
+        ids = [chunk.chunk_id for chunk in chunk_list]
+        return EmbeddingStore(
+            ids=ids,
+            matrix=matrix,
+            id_to_row={chunk_id: row for row, chunk_id in enumerate(ids)},
+        )
+
+    def _select_features(self, df: np.ndarray, doc_count: int) -> np.ndarray:
+        """Return the ids of tokens that survive the DF limits, in id order."""
+        if doc_count == 0:
+            return np.zeros(0, dtype=np.intp)
+        min_count = self.min_df if isinstance(self.min_df, int) else self.min_df * doc_count
+        max_count = self.max_df if isinstance(self.max_df, int) else self.max_df * doc_count
+        keep = np.flatnonzero((df >= min_count) & (df <= max_count))
+        if self.max_features is not None and keep.size > self.max_features:
+            top = np.argsort(-df[keep], kind="stable")[: self.max_features]
+            keep = np.sort(keep[top])
+        return keep
+
+    def _transform_parallel(
+        self, texts: List[TextOrTokens], jobs: int, batch_size: int
+    ) -> sp.csr_matrix:
+        batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+        # Ship the fitted vocabulary/IDF to each worker once, not once per batch.
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(batches)),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            parts = list(pool.map(_transform_batch, batches))
+        return sp.vstack(parts, format="csr")
+
+    def _weigh(self, tokens: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Map ``tokens`` to vocabulary ids and their TF-IDF weights."""
+        if self.idf is None:
             raise RuntimeError("Embedder must be fit before calling transform().")
-        token_counts = Counter(tokenize(text))
-        vector = [0.0] * len(self.vocabulary)
-        max_count = max(token_counts.values()) if token_counts else 1
+        token_counts = Counter(tokens)
+        max_count = max(token_counts.values(), default=1)
+        lookup = self.vocabulary.get
+        ids: List[int] = []
+        counts: List[int] = []
         for token, count in token_counts.items():
-            if token not in self.vocabulary:
+            idx = lookup(token)
+            if idx is None:
                 continue
-            idx = self.vocabulary[token]
-            tf = 0.5 + 0.5 * (count / max_count)
-            vector[idx] = tf * self.idf[idx]
-        return vector
+            ids.append(idx)
+            counts.append(count)
+        id_array = np.asarray(ids, dtype=np.intp)
+        count_array = np.asarray(counts, dtype=np.float64)
+        if self.sublinear_tf:
+            tf = 1.0 + np.log(count_array)
+        else:
+            tf = 0.5 + 0.5 * (count_array / max_count)
+        return id_array, tf * self.idf[id_array]
 
-    def fit_transform_chunks(self, chunks: Iterable[Chunk]) -> Dict[str, Embedding]:
-        chunk_list = list(chunks)
-        self.fit(chunk.text for chunk in chunk_list)
-        embeddings = {
-            chunk.chunk_id: Embedding(key=chunk.chunk_id, vector=self.transform(chunk.text))
-            for chunk in chunk_list
-        }
-        return embeddings
-
-
-def cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
-    dot = sum(a * b for a, b in zip(vec_a, vec_b))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
+
+_WORKER_EMBEDDER: Optional[BagOfWordsEmbedder] = None
+
+
+def _init_worker(embedder: BagOfWordsEmbedder) -> None:
+    global _WORKER_EMBEDDER
+    _WORKER_EMBEDDER = embedder
+
+
+def _transform_batch(batch: List[TextOrTokens]) -> sp.csr_matrix:
+    assert _WORKER_EMBEDDER is not None
+    return _WORKER_EMBEDDER.transform_many(batch)
+
+
+def normalize_rows(matrix: sp.csr_matrix) -> sp.csr_matrix:
+    """Return a float32 copy of ``matrix`` with L2-normalised rows.
+
+    With unit rows, cosine similarity against a unit query is a plain dot
+    product, so a whole corpus can be scored with one matrix-vector call.
+    """
+    normalized = sp.csr_matrix(matrix, dtype=np.float32, copy=True)
+    norms = np.sqrt(normalized.multiply(normalized).sum(axis=1)).A1
+    norms[norms == 0] = 1.0
+    normalized.data /= np.repeat(norms, np.diff(normalized.indptr)).astype(np.float32)
+    return normalized
+
+
+def cosine_similarity(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
+    norm_a = np.linalg.norm(vec_a)
+    norm_b = np.linalg.norm(vec_b)
     if norm_a == 0 or norm_b == 0:
         return 0.0
-    return dot / (norm_a * norm_b)
+    return float(np.dot(vec_a, vec_b) / (norm_a * norm_b))
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import re
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
 from dataclasses import dataclass
-from itertools import combinations
 from typing import Dict, Iterable, List, Sequence
 
-from .chunker import Chunk
-
+import numpy as np
+import scipy.sparse as sp
 
-ENTITY_PATTERN = re.compile(r"\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\b")
+from .chunker import Chunk
+# ENTITY_PATTERN lived here before tokenization.py; re-exported for old imports.
+from .tokenization import ENTITY_PATTERN  # noqa: F401
 
 
 @dataclass
@@ -29,41 +30,101 @@ class Relation:
     description: str
 
 
+@dataclass
+class Extraction:
+    """Entities, relations, and the chunk -> entity index from one pass."""
+
+    entities: Dict[str, Entity]
+    relations: List[Relation]
+    mentions: Dict[str, List[str]]
+
+
 def extract_entities(chunks: Iterable[Chunk], min_freq: int = 2) -> Dict[str, Entity]:
     """Extract entities by counting capitalized n-grams."""
     counter: Counter[str] = Counter()
     for chunk in chunks:
-        matches = ENTITY_PATTERN.findall(chunk.text)
-        counter.update(matches)
+        counter.update(chunk.entity_spans)
+    return _select_entities(counter, min_freq)
+
+
+def extract_entities_and_relations(chunks: Iterable[Chunk], min_freq: int = 2) -> Extraction:
+    """Extract entities, their co-occurrence relations, and mentions in one traversal."""
+    counter: Counter[str] = Counter()
+    per_chunk_spans: List[tuple[str, List[str]]] = []
+    for chunk in chunks:
+        counter.update(chunk.entity_spans)
+        per_chunk_spans.append((chunk.chunk_id, list(dict.fromkeys(chunk.entity_spans))))
+
+    entities = _select_entities(counter, min_freq)
+    entity_labels = {entity.label: entity_id for entity_id, entity in entities.items()}
+    mentions = {
+        chunk_id: [entity_labels[span] for span in spans if span in entity_labels]
+        for chunk_id, spans in per_chunk_spans
+    }
+    relations = _relations_from_mentions(mentions, entities)
+    return Extraction(entities=entities, relations=relations, mentions=mentions)
+
 
+def _select_entities(counter: Counter[str], min_freq: int) -> Dict[str, Entity]:
     entities: Dict[str, Entity] = {}
     for label, freq in counter.items():
         if freq < min_freq:
             continue
-        entity_id = label.lower().replace(" ", "_")
+        # Interned: these ids key dicts and graph nodes throughout the pipeline.
+        entity_id = sys.intern(label.lower().replace(" ", "_"))
         entities[entity_id] = Entity(entity_id=entity_id, label=label, frequency=freq)
     return entities
 
 
+def map_mentions(
+    chunks: Iterable[Chunk],
+    entities: Dict[str, Entity],
+) -> Dict[str, List[str]]:
+    """Build a ``chunk_id -> entity_ids`` reverse index from cached entity spans.
+
+    Entity ids are listed once each, in order of first appearance.
+    """
+    entity_labels = {entity.label: entity_id for entity_id, entity in entities.items()}
+    return {
+        chunk.chunk_id: [
+            entity_labels[span]
+            for span in dict.fromkeys(chunk.entity_spans)
+            if span in entity_labels
+        ]
+        for chunk in chunks
+    }
+
+
 def extract_relations(
     chunks: Iterable[Chunk],
     entities: Dict[str, Entity],
 ) -> List[Relation]:
     """Create co-occurrence relations between entities within chunks."""
-    relations: Dict[tuple[str, str], int] = defaultdict(int)
+    return _relations_from_mentions(map_mentions(chunks, entities), entities)
 
-    entity_labels = {entity.label: entity_id for entity_id, entity in entities.items()}
-    for chunk in chunks:
-        matches = [
-            entity_labels[m]
-            for m in ENTITY_PATTERN.findall(chunk.text)
-            if m in entity_labels
-        ]
-        for head, tail in combinations(sorted(set(matches)), 2):
-            relations[(head, tail)] += 1
+
+def _relations_from_mentions(
+    mentions: Dict[str, List[str]],
+    entities: Dict[str, Entity],
+) -> List[Relation]:
+    """Count pairwise co-occurrences as ``M.T @ M`` over a chunk x entity incidence matrix."""
+    entity_ids = list(entities)
+    column = {entity_id: idx for idx, entity_id in enumerate(entity_ids)}
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, chunk_entities in enumerate(mentions.values()):
+        for entity_id in chunk_entities:
+            rows.append(row)
+            cols.append(column[entity_id])
+    incidence = sp.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(mentions), len(entity_ids)),
+    )
+    co_occurrence = sp.triu(incidence.T @ incidence, k=1, format="coo")
 
     relation_objs: List[Relation] = []
-    for (head, tail), weight in relations.items():
+    for i, j, weight in zip(co_occurrence.row, co_occurrence.col, co_occurrence.data):
+        head, tail = sorted((entity_ids[i], entity_ids[j]))
         description = f"Co-occurs with {entities[tail].label}"
         relation_objs.append(Relation(head_id=head, tail_id=tail, weight=float(weight), description=description))
 
@@ -0,0 +1,83 @@
+"""Graph serialisation helpers."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from typing import Any, List, Union
+
+import networkx as nx
+
+
+class ZstandardImportError(ImportError):
+    """Raised when ``.zst`` output is requested but zstandard is not installed."""
+
+
+def write_graphml(graph: nx.Graph, path: Union[str, Path]) -> None:
+    """Write ``graph`` to ``path`` as compact GraphML.
+
+    With ``lxml`` installed, elements are streamed to the file one at a time
+    instead of building the whole XML tree in memory first; otherwise NetworkX
+    falls back to its ElementTree writer. Paths ending in ``.gz`` or ``.bz2``
+    are compressed on the fly, as are ``.zst`` paths when the optional
+    ``zstandard`` package is installed.
+    """
+    path = Path(path)
+    if path.suffix == ".zst":
+        compressor = _zstd_compressor()
+        with open(path, "wb") as handle, compressor.stream_writer(handle) as stream:
+            nx.write_graphml_lxml(graph, stream, prettyprint=False)
+        return
+    nx.write_graphml_lxml(graph, str(path), prettyprint=False)
+
+
+def _zstd_compressor() -> Any:
+    try:
+        import zstandard  # type: ignore
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ZstandardImportError(
+            "zstandard is required to write .zst files. Install with "
+            "`pip install zstandard`."
+        ) from exc
+    # threads=-1 compresses on background threads while the XML is serialised.
+    return zstandard.ZstdCompressor(level=3, threads=-1)
+
+
+def write_graph_pickle(graph: nx.Graph, path: Union[str, Path]) -> None:
+    """Write ``graph`` to ``path`` as a pickle for fast, lossless reloading.
+
+    Uses protocol 5 with out-of-band buffers (PEP 574): large contiguous
+    attribute values such as NumPy arrays are written as raw bytes after the
+    pickle stream instead of being copied into it. The file starts with a
+    small pickled header of segment lengths so :func:`read_graph_pickle` can
+    hand the buffers back to ``pickle.loads``.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    payload = pickle.dumps(graph, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    with open(path, "wb") as handle:
+        pickle.dump([len(payload)] + [raw.nbytes for raw in raws], handle, protocol=5)
+        handle.write(payload)
+        for raw in raws:
+            handle.write(raw)
+
+
+def read_graph_pickle(path: Union[str, Path]) -> nx.Graph:
+    """Load a graph written by :func:`write_graph_pickle`.
+
+    Only load files you trust: unpickling can execute arbitrary code.
+    Raises ``ValueError`` if the file is shorter than its header says, since
+    missing out-of-band bytes would otherwise come back as zeros.
+    """
+    with open(path, "rb") as handle:
+        sizes = pickle.load(handle)
+        payload = handle.read(sizes[0])
+        if len(payload) != sizes[0]:
+            raise ValueError(f"{path} is truncated: graph pickle is incomplete.")
+        buffers = []
+        for index, size in enumerate(sizes[1:], 1):
+            buffer = bytearray(size)
+            if handle.readinto(buffer) != size:
+                raise ValueError(f"{path} is truncated: out-of-band buffer {index} is incomplete.")
+            buffers.append(buffer)
+    return pickle.loads(payload, buffers=buffers)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
-from typing import Optional, Sequence
+from functools import partial
+from typing import List, Optional, Sequence
 
 try:
     from dotenv import load_dotenv  # type: ignore
@@ -98,10 +100,21 @@ class GeminiAnswerGenerator:
         )
         return prompt
 
-    def answer(self, question: str, contexts: Sequence[str]) -> str:
+    def answer(
+        self,
+        question: str,
+        contexts: Sequence[str],
+        *,
+        prompt: Optional[str] = None,
+    ) -> str:
+        """Answer ``question`` from ``contexts``.
+
+        Pass ``prompt`` to reuse one already produced by :meth:`build_prompt`.
+        """
         if not contexts:
             return "No retrieved context was provided for Gemini."
-        prompt = self.build_prompt(question, contexts)
+        if prompt is None:
+            prompt = self.build_prompt(question, contexts)
 
         response = self._model.generate_content(
             prompt,
@@ -122,6 +135,27 @@ class GeminiAnswerGenerator:
             return "Gemini returned an empty response."
         return text.strip()
 
+    async def answer_many(
+        self,
+        questions: Sequence[str],
+        contexts_list: Sequence[Sequence[str]],
+    ) -> List[str]:
+        """Answer several questions concurrently, preserving input order.
+
+        Each blocking SDK call runs in the event loop's default executor so
+        network round-trips overlap. This is for callers already in async
+        code; synchronous batches go through
+        :meth:`GraphRAGPipeline.query_batch_with_gemini`, which uses threads.
+        """
+        if len(questions) != len(contexts_list):
+            raise ValueError("questions and contexts_list must have the same length.")
+        loop = asyncio.get_running_loop()
+        pending = [
+            loop.run_in_executor(None, partial(self.answer, question, contexts))
+            for question, contexts in zip(questions, contexts_list)
+        ]
+        return list(await asyncio.gather(*pending))
+
 
 def _extract_primary_text(response: object) -> str:
     candidates = getattr(response, "candidates", None) or []
@@ -2,57 +2,125 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
 
 import networkx as nx
+import numpy as np
 
 from .chunker import Chunk
-from .entity_extraction import Entity, Relation
+from .entity_extraction import Entity, Relation, map_mentions
 
 
 Graph = nx.Graph
 
+NODE_TYPES = ("chunk", "entity")
+EDGE_TYPES = ("mentions", "co_occurs")
+
 
 def build_graph(
     chunks: Iterable[Chunk],
     entities: Dict[str, Entity],
     relations: Iterable[Relation],
+    mentions: Optional[Mapping[str, Sequence[str]]] = None,
 ) -> Graph:
-    graph = nx.Graph()
+    """Assemble the chunk/entity graph.
 
-    for chunk in chunks:
-        graph.add_node(
-            chunk.chunk_id, # Node ID
-            type="chunk", # Node Property
-            doc_id=chunk.doc_id, # Node Property
-            text=chunk.text, # Node Property
-        )
+    ``mentions`` is the ``chunk_id -> entity_ids`` index from
+    :func:`map_mentions`; it is computed here when not supplied.
+    """
+    chunks = list(chunks)
+    if mentions is None:
+        mentions = map_mentions(chunks, entities)
 
-    for entity in entities.values():
-        graph.add_node(
+    graph = nx.Graph()
+    graph.add_nodes_from(
+        (
+            chunk.chunk_id,  # Node ID
+            {"type": "chunk", "doc_id": chunk.doc_id, "text": chunk.text},  # Node Properties
+        )
+        for chunk in chunks
+    )
+    graph.add_nodes_from(
+        (
             entity.entity_id,
-            type="entity",
-            label=entity.label,
-            frequency=entity.frequency,
+            {"type": "entity", "label": entity.label, "frequency": entity.frequency},
         )
+        for entity in entities.values()
+    )
 
-    for chunk in chunks:
-        chunk_entities = [
-            entity_id
-            for entity_id, entity in entities.items()
-            if entity.label in chunk.text
-        ]
-        for entity_id in chunk_entities:
-            graph.add_edge(chunk.chunk_id, entity_id, type="mentions", weight=1.0)
-
-    for relation in relations:
-        if not graph.has_node(relation.head_id) or not graph.has_node(relation.tail_id):
-            continue
-        graph.add_edge(
+    graph.add_edges_from(
+        (chunk_id, entity_id, {"type": "mentions", "weight": 1.0})
+        for chunk_id, entity_ids in mentions.items()
+        for entity_id in entity_ids
+    )
+    graph.add_edges_from(
+        (
             relation.head_id,
             relation.tail_id,
-            type="co_occurs",
-            weight=relation.weight,
-            description=relation.description,
+            {
+                "type": "co_occurs",
+                "weight": relation.weight,
+                "description": relation.description,
+            },
         )
+        for relation in relations
+        if graph.has_node(relation.head_id) and graph.has_node(relation.tail_id)
+    )
     return graph
+
+
+@dataclass
+class AdjacencyIndex:
+    """Frozen CSR view of a graph for array-based neighbor lookups.
+
+    Node ``i`` is ``nodes[i]``; its neighbors are
+    ``neighbors[indptr[i]:indptr[i + 1]]`` with matching ``edge_types``.
+    Type columns hold positions in ``NODE_TYPES``/``EDGE_TYPES`` (``-1``
+    for anything else).
+    """
+
+    nodes: List[str]
+    node_ids: Dict[str, int]
+    node_types: np.ndarray
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    edge_types: np.ndarray
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "AdjacencyIndex":
+        nodes = list(graph.nodes())
+        node_ids = {node: idx for idx, node in enumerate(nodes)}
+        node_codes = {name: code for code, name in enumerate(NODE_TYPES)}
+        edge_codes = {name: code for code, name in enumerate(EDGE_TYPES)}
+
+        node_types = np.fromiter(
+            (node_codes.get(data.get("type"), -1) for _, data in graph.nodes(data=True)),
+            dtype=np.int8,
+            count=len(nodes),
+        )
+        indptr = [0]
+        neighbors: List[int] = []
+        edge_types: List[int] = []
+        for node in nodes:
+            for neighbor, data in graph.adj[node].items():
+                neighbors.append(node_ids[neighbor])
+                edge_types.append(edge_codes.get(data.get("type"), -1))
+            indptr.append(len(neighbors))
+
+        return cls(
+            nodes=nodes,
+            node_ids=node_ids,
+            node_types=node_types,
+            indptr=np.asarray(indptr, dtype=np.intp),
+            neighbors=np.asarray(neighbors, dtype=np.intp),
+            edge_types=np.asarray(edge_types, dtype=np.int8),
+        )
+
+    def neighbors_of(self, node: int, edge_type: Optional[str] = None) -> np.ndarray:
+        """Return neighbor ids of ``node``, optionally limited to one edge type."""
+        start, end = self.indptr[node], self.indptr[node + 1]
+        found = self.neighbors[start:end]
+        if edge_type is not None:
+            found = found[self.edge_types[start:end] == EDGE_TYPES.index(edge_type)]
+        return found
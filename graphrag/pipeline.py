@@ -2,27 +2,78 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import multiprocessing
+import os
+import pickle
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from .chunker import Chunk, chunk_corpus
-from .data_loader import Document, load_documents
-from .embedder import BagOfWordsEmbedder
-from .entity_extraction import Entity, extract_entities, extract_relations
+from .data_loader import Document, iter_source_files, load_files
+from .embedder import BagOfWordsEmbedder, EmbeddingStore
+from .entity_extraction import Entity, extract_entities_and_relations
 from .graph_builder import Graph, build_graph
 from .gemini import GeminiAnswerGenerator, GeminiConfig
 from .retrieval import GraphRetriever, RetrievalResult
 
 
+DEFAULT_CACHE_DIR = Path("~/.cache/graphrag")
+
+# Concurrent Gemini requests in query_batch_with_gemini; the calls wait on
+# the network, so threads overlap them without competing for the CPU.
+GEMINI_THREADS = 8
+
+# Bump whenever PipelineArtifacts or anything it pickles changes shape.
+CACHE_VERSION = 1
+
+
+def manifest_digest(files: Iterable[Path]) -> str:
+    """Hash the (path, mtime, size) of every file in ``files``.
+
+    Any added, removed, renamed, or edited file changes the digest, which
+    is what keys the on-disk artefact cache. So does editing a ``graphrag``
+    module (see :func:`_build_fingerprint`).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"graphrag-cache-v{CACHE_VERSION}\n".encode())
+    digest.update(_build_fingerprint().encode())
+    for file_path in sorted(files):
+        stat = file_path.stat()
+        digest.update(f"{file_path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _build_fingerprint() -> str:
+    """Hash the (name, mtime, size) of every ``graphrag`` module.
+
+    Build parameters (chunk size and overlap, ``min_freq``, the embedder's
+    DF limits, ...) are defaults in these modules, so this covers both the
+    pipeline code and its configuration.
+    """
+    lines = []
+    for module in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        stat = module.stat()
+        lines.append(f"{module.name}\0{stat.st_mtime_ns}\0{stat.st_size}\n")
+    return "".join(lines)
+
+
 @dataclass
 class PipelineArtifacts:
     documents: List[Document]
     chunks: List[Chunk]
     entities: Dict[str, Entity]
     graph: Graph
-    chunk_embeddings: Dict[str, List[float]]
-    embedder: BagOfWordsEmbedder
+    # None for shape_only builds, which skip embedding (see GraphRAGPipeline.from_path).
+    chunk_embeddings: Optional[EmbeddingStore] = None
+    embedder: Optional[BagOfWordsEmbedder] = None
 
 
 class GraphRAGPipeline:
@@ -30,45 +81,125 @@ class GraphRAGPipeline:
 
     def __init__(self, artifacts: PipelineArtifacts):
         self.artifacts = artifacts
+        # Manifest digest of the source files when built with a cache_dir;
+        # lets callers key their own derived caches to the same corpus.
+        self.source_digest: Optional[str] = None
+        self._gemini_generators: Dict[Tuple[str, str, float, int], GeminiAnswerGenerator] = {}
 
-        chunk_index = {chunk.chunk_id: chunk for chunk in artifacts.chunks}
-        self.retriever = GraphRetriever(
-            graph=artifacts.graph,
-            chunk_index=chunk_index,
-            embedder=artifacts.embedder,
-            chunk_embeddings=artifacts.chunk_embeddings,
-        )
+        self._retriever: Optional[GraphRetriever] = None
+        if artifacts.embedder is not None and artifacts.chunk_embeddings is not None:
+            chunk_index = {chunk.chunk_id: chunk for chunk in artifacts.chunks}
+            self._retriever = GraphRetriever(
+                graph=artifacts.graph,
+                chunk_index=chunk_index,
+                embedder=artifacts.embedder,
+                chunk_embeddings=artifacts.chunk_embeddings,
+            )
+
+    @property
+    def retriever(self) -> GraphRetriever:
+        if self._retriever is None:
+            raise RuntimeError(
+                "This pipeline was built without embeddings (shape only) and cannot retrieve."
+            )
+        return self._retriever
 
     @classmethod
-    def from_path(cls, path: Path) -> "GraphRAGPipeline":
-        documents = load_documents(path)
-        chunks = chunk_corpus(documents)
+    def from_path(
+        cls,
+        path: Path,
+        *,
+        cache_dir: Optional[Path] = None,
+        shape_only: bool = False,
+        jobs: Optional[int] = None,
+        batch_size: int = 512,
+    ) -> "GraphRAGPipeline":
+        """Build every artefact for the corpus at ``path``.
 
-        entities = extract_entities(chunks)
-        relations = extract_relations(chunks, entities)
+        Args:
+            path: File or directory of source documents.
+            cache_dir: Reuse artefacts pickled here by an earlier run (e.g.
+                ``DEFAULT_CACHE_DIR``), and cache new builds; ``None``
+                always builds afresh. Entries are named
+                ``<corpus>-<digest>.pkl``: ``corpus`` names the directory
+                the sources share and the digest comes from
+                :func:`manifest_digest`, so any source or ``graphrag`` edit
+                triggers a rebuild, which replaces the corpus's older
+                entries. Unreadable entries are ignored and an unwritable
+                cache only costs a warning.
+            shape_only: Skip embedding, the costliest step. The result
+                serves :meth:`explain_graph` and graph exports but cannot
+                retrieve. A cached full build is still returned when there
+                is one; shape-only builds are never cached.
+            jobs: Worker processes for embedding large corpora; ``None``
+                uses every CPU.
+            batch_size: Chunks handed to an embedding worker at a time.
+        """
+        return cls.from_files(
+            list(iter_source_files(path)),
+            cache_dir=cache_dir,
+            shape_only=shape_only,
+            jobs=jobs,
+            batch_size=batch_size,
+        )
 
-        graph = build_graph(chunks, entities, relations)
+    @classmethod
+    def from_files(
+        cls,
+        files: Sequence[Path],
+        *,
+        cache_dir: Optional[Path] = None,
+        shape_only: bool = False,
+        jobs: Optional[int] = None,
+        batch_size: int = 512,
+    ) -> "GraphRAGPipeline":
+        """Like :meth:`from_path`, for files already listed by :func:`iter_source_files`."""
+        if cache_dir is None:
+            return cls(_build_artifacts(files, shape_only, jobs, batch_size))
 
-        embedder = BagOfWordsEmbedder()
-        embedder.fit(chunk.text for chunk in chunks)
-        chunk_embeddings = {
-            chunk.chunk_id: embedder.transform(chunk.text)
-            for chunk in chunks
-        }
+        cache_dir = Path(cache_dir).expanduser()
+        digest = manifest_digest(files)
+        prefix = _corpus_prefix(files)
+        cache_file = cache_dir / f"{prefix}-{digest}.pkl"
+        if cache_file.is_file():
+            try:
+                with open(cache_file, "rb") as handle:
+                    pipeline = cls(pickle.load(handle))
+                pipeline.source_digest = digest
+                return pipeline
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+                pass
 
-        artifacts = PipelineArtifacts(
-            documents=documents,
-            chunks=chunks,
-            entities=entities,
-            graph=graph,
-            chunk_embeddings=chunk_embeddings,
-            embedder=embedder,
-        )
-        return cls(artifacts)
+        pipeline = cls(_build_artifacts(files, shape_only, jobs, batch_size))
+        if shape_only:
+            return pipeline
+        pipeline.source_digest = digest
+        try:
+            _write_cache(cache_file, pipeline.artifacts)
+        except OSError as exc:
+            warnings.warn(f"Could not write pipeline cache to {cache_dir}: {exc}", stacklevel=2)
+            return pipeline
+        for stale in cache_dir.glob(f"{prefix}-*.pkl"):
+            if stale != cache_file:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+        return pipeline
 
     def retrieve(self, question: str, top_k: int = 5) -> List[RetrievalResult]:
         return self.retriever.query(question, k=top_k)
 
+    def iter_retrieve(self, question: str, top_k: int = 5) -> Iterator[RetrievalResult]:
+        """Yield :meth:`retrieve` results lazily; see :meth:`GraphRetriever.iter_query`."""
+        return self.retriever.iter_query(question, k=top_k)
+
+    def retrieve_batch(
+        self, questions: Sequence[str], top_k: int = 5
+    ) -> List[List[RetrievalResult]]:
+        """Retrieve for many questions at once; see :meth:`GraphRetriever.query_many`."""
+        return self.retriever.query_many(questions, k=top_k)
+
     def query(self, question: str, top_k: int = 3) -> str:
         results = self.retrieve(question, top_k=top_k)
         answer = self._synthesise_answer(question, results)
@@ -91,6 +222,115 @@ class GraphRAGPipeline:
     ) -> str:
         results = self.retrieve(question, top_k=top_k)
         contexts = [result.text for result in results[:top_k]]
+        generator = self.gemini_generator(
+            api_key=api_key,
+            model=model,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            env_var=env_var,
+        )
+        answer = generator.answer(question, contexts)
+        context = "\n\n".join(
+            f"[{idx+1}] Score={result.score:.2f} Trail -> {' -> '.join(result.trail)}\n{result.text}"
+            for idx, result in enumerate(results[:top_k])
+        )
+        return f"Question: {question}\n\nAnswer:\n{answer}\n\nContext:\n{context}"
+
+    def query_batch(
+        self, questions: Sequence[str], top_k: int = 3, *, workers: Optional[int] = 1
+    ) -> List[Dict[str, Any]]:
+        """Answer every question against this pipeline, one record per question.
+
+        Each record holds ``question``, ``answer``, and ``contexts`` (the top
+        ``top_k`` retrieval results as plain dicts), ready for JSON output.
+        ``workers`` processes share the questions; ``None`` uses every CPU.
+        """
+        return self._map_questions("_query_records", questions, top_k, workers)
+
+    def query_batch_with_gemini(
+        self,
+        questions: Sequence[str],
+        top_k: int = 3,
+        *,
+        api_key: Optional[str] = None,
+        model: str = "models/gemini-1.5-flash",
+        temperature: float = 0.2,
+        max_output_tokens: int = 512,
+        env_var: str = "GOOGLE_GEMINI_API_KEY",
+        workers: Optional[int] = 1,
+    ) -> List[Dict[str, Any]]:
+        """Like :meth:`query_batch`, with Gemini answering all questions concurrently.
+
+        Gemini calls are network-bound, so up to ``GEMINI_THREADS`` of them
+        overlap on threads regardless of ``workers``, which only parallelises
+        retrieval. Unlike :meth:`GeminiAnswerGenerator.answer_many`, this
+        needs no event loop and so also works inside a running one (Jupyter).
+        """
+        batches = self._map_questions("_top_results", questions, top_k, workers)
+        generator = self.gemini_generator(
+            api_key=api_key,
+            model=model,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            env_var=env_var,
+        )
+        contexts_list = [[result.text for result in results[:top_k]] for results in batches]
+        with ThreadPoolExecutor(max_workers=GEMINI_THREADS) as pool:
+            answers = list(pool.map(generator.answer, questions, contexts_list))
+        return _batch_records(questions, answers, batches, top_k)
+
+    def _query_records(self, questions: Sequence[str], top_k: int) -> List[Dict[str, Any]]:
+        batches = self.retrieve_batch(questions, top_k=top_k)
+        answers = [
+            self._synthesise_answer(question, results)
+            for question, results in zip(questions, batches)
+        ]
+        return _batch_records(questions, answers, batches, top_k)
+
+    def _top_results(self, questions: Sequence[str], top_k: int) -> List[List[RetrievalResult]]:
+        return [results[:top_k] for results in self.retrieve_batch(questions, top_k=top_k)]
+
+    def _map_questions(
+        self, method: str, questions: Sequence[str], top_k: int, workers: Optional[int]
+    ) -> List[Any]:
+        """Run ``self.<method>(questions, top_k)``, split over forked workers if asked.
+
+        Workers are forked so they share the artefacts without pickling them,
+        and ``method`` must return one small item per question: full
+        expansion lists are too large to ship back cheaply. Where ``fork`` is
+        unavailable the call runs in-process.
+        """
+        workers = workers or os.cpu_count() or 1
+        if (
+            workers <= 1
+            or len(questions) <= 1
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return getattr(self, method)(questions, top_k)
+
+        questions = list(questions)
+        # A few slices per worker evens out questions with costlier expansions.
+        size = max(1, -(-len(questions) // (4 * workers)))
+        slices = [questions[start:start + size] for start in range(0, len(questions), size)]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(slices)),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            parts = pool.map(_call_slice, [method] * len(slices), slices, [top_k] * len(slices))
+            return list(chain.from_iterable(parts))
+
+    def gemini_generator(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        model: str = "models/gemini-1.5-flash",
+        temperature: float = 0.2,
+        max_output_tokens: int = 512,
+        env_var: str = "GOOGLE_GEMINI_API_KEY",
+    ) -> GeminiAnswerGenerator:
+        """Return a Gemini generator, reusing one already built for the same settings."""
         if api_key:
             config = GeminiConfig(
                 api_key=api_key,
@@ -106,17 +346,17 @@ class GraphRAGPipeline:
                 max_output_tokens=max_output_tokens,
             )
 
-        generator = GeminiAnswerGenerator(config)
-        answer = generator.answer(question, contexts)
-        context = "\n\n".join(
-            f"[{idx+1}] Score={result.score:.2f} Trail -> {' -> '.join(result.trail)}\n{result.text}"
-            for idx, result in enumerate(results[:top_k])
-        )
-        return f"Question: {question}\n\nAnswer:\n{answer}\n\nContext:\n{context}"
+        key = (config.api_key, config.model, config.temperature, config.max_output_tokens)
+        generator = self._gemini_generators.get(key)
+        if generator is None:
+            generator = GeminiAnswerGenerator(config)
+            self._gemini_generators[key] = generator
+        return generator
 
     def explain_graph(self) -> str:
+        graph = self.artifacts.graph
         node_counts = {}
-        for _, data in self.artifacts.graph.nodes(data=True):
+        for _, data in graph.nodes(data=True):
             node_type = data.get("type", "unknown")
             node_counts[node_type] = node_counts.get(node_type, 0) + 1
 
@@ -126,7 +366,11 @@ class GraphRAGPipeline:
         ]
         for node_type, count in sorted(node_counts.items()):
             lines.append(f"{node_type.title()} nodes: {count}")
-        lines.append(f"Edges: {self.artifacts.graph.number_of_edges()}")
+        lines.append(f"Edges: {graph.number_of_edges()}")
+        # Same as averaging graph.degree(), without visiting every node again.
+        node_total = graph.number_of_nodes()
+        mean_degree = 2 * graph.number_of_edges() / node_total if node_total else 0.0
+        lines.append(f"Mean degree: {mean_degree:.2f}")
         lines.append(f"Documents: {len(self.artifacts.documents)}")
         lines.append(f"Chunks: {len(self.artifacts.chunks)}")
         return "\n".join(lines)
@@ -139,3 +383,77 @@ class GraphRAGPipeline:
             snippet = result.text.strip().split(". ")[0]
             bullet_points.append(f"- {snippet}")
         return "\n".join(bullet_points)
+
+
+def _build_artifacts(
+    files: Sequence[Path], shape_only: bool, jobs: Optional[int], batch_size: int
+) -> PipelineArtifacts:
+    documents = load_files(files)
+    chunks = chunk_corpus(documents)
+
+    extraction = extract_entities_and_relations(chunks)
+    entities = extraction.entities
+
+    graph = build_graph(chunks, entities, extraction.relations, extraction.mentions)
+
+    artifacts = PipelineArtifacts(
+        documents=documents,
+        chunks=chunks,
+        entities=entities,
+        graph=graph,
+    )
+    if not shape_only:
+        embedder = BagOfWordsEmbedder()
+        artifacts.chunk_embeddings = embedder.fit_transform_chunks(
+            chunks, jobs=jobs, batch_size=batch_size
+        )
+        artifacts.embedder = embedder
+    return artifacts
+
+
+def _corpus_prefix(files: Sequence[Path]) -> str:
+    """Short name shared by every cache entry built from the same source directory."""
+    root = os.path.abspath(os.path.commonpath(files)) if files else ""
+    return hashlib.blake2b(root.encode(), digest_size=6).hexdigest()
+
+
+def _write_cache(cache_file: Path, artifacts: PipelineArtifacts) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so readers never see a partial pickle.
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(artifacts, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+_WORKER_PIPELINE: Optional[GraphRAGPipeline] = None
+
+
+def _init_worker(pipeline: GraphRAGPipeline) -> None:
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = pipeline
+
+
+def _call_slice(method: str, questions: List[str], top_k: int) -> List[Any]:
+    assert _WORKER_PIPELINE is not None
+    return getattr(_WORKER_PIPELINE, method)(questions, top_k)
+
+
+def _batch_records(
+    questions: Sequence[str],
+    answers: Sequence[str],
+    batches: Sequence[Sequence[RetrievalResult]],
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            "question": question,
+            "answer": answer,
+            "contexts": [asdict(result) for result in results[:top_k]],
+        }
+        for question, answer, results in zip(questions, answers, batches)
+    ]
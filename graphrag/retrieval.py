@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 import networkx as nx
+import numpy as np
 
 from .chunker import Chunk
-from .embedder import BagOfWordsEmbedder, cosine_similarity
+from .embedder import BagOfWordsEmbedder, EmbeddingStore, normalize_rows
+from .graph_builder import NODE_TYPES, AdjacencyIndex
 
 
 @dataclass
@@ -25,67 +28,102 @@ class GraphRetriever:
         graph: nx.Graph,
         chunk_index: Dict[str, Chunk],
         embedder: BagOfWordsEmbedder,
-        chunk_embeddings: Dict[str, List[float]],
+        chunk_embeddings: EmbeddingStore,
     ):
         self.graph = graph
         self.chunk_index = chunk_index
         self.embedder = embedder
         self.chunk_embeddings = chunk_embeddings
+        self._matrix = normalize_rows(chunk_embeddings.matrix)
+        self._adjacency = AdjacencyIndex.from_graph(graph)
+        self._chunk_mask = self._adjacency.node_types == NODE_TYPES.index("chunk")
 
     def query(self, text: str, k: int = 5) -> List[RetrievalResult]:
         query_vec = self.embedder.transform(text)
-        scored_chunks = self._score_chunks(query_vec)
-        top_chunks = scored_chunks[:k]
-        expanded = self._expand_via_graph(top_chunks)
-        return expanded
-
-    def _score_chunks(self, query_vec: List[float]) -> List[Tuple[str, float]]:
-        scores = []
-        for chunk_id, embedding in self.chunk_embeddings.items():
-            score = cosine_similarity(query_vec, embedding)
-            scores.append((chunk_id, score))
-        scores.sort(key=lambda item: item[1], reverse=True)
-        return scores
+        return self._expand_via_graph(self._score_chunks(query_vec, k))
+
+    def iter_query(self, text: str, k: int = 5) -> Iterator[RetrievalResult]:
+        """Yield the results of :meth:`query` one at a time, best first.
+
+        Ranking still needs every hit, but hits are kept as compact tuples
+        and each :class:`RetrievalResult` is only built when the consumer
+        asks for it, so single-pass callers never hold the full list.
+        """
+        query_vec = self.embedder.transform(text)
+        hits = self._ranked_hits(self._score_chunks(query_vec, k))
+        chunk_index = self.chunk_index
+        return (
+            RetrievalResult(chunk_id, score, chunk_index[chunk_id].text, trail)
+            for chunk_id, score, trail in hits
+        )
+
+    def query_many(self, texts: Sequence[str], k: int = 5) -> List[List[RetrievalResult]]:
+        """Run :meth:`query` for every text, embedding and scoring them together.
+
+        All queries are embedded in one ``transform_many`` call and scored
+        against the corpus with a single sparse matrix product.
+        """
+        if not texts:
+            return []
+        queries = normalize_rows(self.embedder.transform_many(texts))
+        scores = (queries @ self._matrix.T).toarray()
+        return [self._expand_via_graph(self._top_k(row, k)) for row in scores]
+
+    def _score_chunks(self, query_vec: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        norm = np.linalg.norm(query_vec)
+        if norm == 0:
+            scores = np.zeros(len(self.chunk_embeddings.ids), dtype=np.float32)
+        else:
+            scores = self._matrix @ (query_vec / norm).astype(np.float32)
+        return self._top_k(scores, k)
+
+    def _top_k(self, scores: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        chunk_ids = self.chunk_embeddings.ids
+        if not chunk_ids or k <= 0:
+            return []
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(chunk_ids[idx], float(scores[idx])) for idx in top]
 
     def _expand_via_graph(self, top_chunks: List[Tuple[str, float]]) -> List[RetrievalResult]:
-        results: List[RetrievalResult] = []
-        visited = set()
+        chunk_index = self.chunk_index
+        return [
+            RetrievalResult(chunk_id, score, chunk_index[chunk_id].text, trail)
+            for chunk_id, score, trail in self._ranked_hits(top_chunks)
+        ]
+
+    def _ranked_hits(
+        self, top_chunks: List[Tuple[str, float]]
+    ) -> List[Tuple[str, float, List[str]]]:
+        """Return ``(chunk_id, score, trail)`` for direct hits and expansions, best first."""
+        hits: List[Tuple[str, float, List[str]]] = []
+        # Direct hits are never re-added as expansions of one another.
+        visited = {chunk_id for chunk_id, _ in top_chunks}
+        best: Dict[str, Tuple[float, List[str]]] = {}
 
+        adjacency = self._adjacency
         for chunk_id, base_score in top_chunks:
-            if chunk_id not in self.graph:
+            node = adjacency.node_ids.get(chunk_id)
+            if node is None:
                 continue
-            trail = [chunk_id]
-            score = base_score
-            for neighbor in self.graph.neighbors(chunk_id):
-                edge = self.graph[chunk_id][neighbor]
-                if edge.get("type") != "mentions":
-                    continue
-                for expansion in self.graph.neighbors(neighbor):
-                    if expansion == chunk_id:
-                        continue
+            expanded_score = base_score * 0.8
+            for entity in adjacency.neighbors_of(node, "mentions"):
+                neighbor = adjacency.nodes[entity]
+                candidates = adjacency.neighbors_of(entity)
+                candidates = candidates[self._chunk_mask[candidates] & (candidates != node)]
+                for candidate in candidates:
+                    expansion = adjacency.nodes[candidate]
                     if expansion in visited:
                         continue
-                    if self.graph.nodes[expansion].get("type") != "chunk":
+                    previous = best.get(expansion)
+                    if previous is not None and previous[0] >= expanded_score:
                         continue
-                    expanded_score = base_score * 0.8
-                    results.append(
-                        RetrievalResult(
-                            chunk_id=expansion,
-                            score=expanded_score,
-                            text=self.chunk_index[expansion].text,
-                            trail=[chunk_id, neighbor, expansion],
-                        )
-                    )
-                    visited.add(expansion)
-            results.append(
-                RetrievalResult(
-                    chunk_id=chunk_id,
-                    score=score,
-                    text=self.chunk_index[chunk_id].text,
-                    trail=trail,
-                )
-            )
-            visited.add(chunk_id)
-
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results
+                    best[expansion] = (expanded_score, [chunk_id, neighbor, expansion])
+            hits.append((chunk_id, base_score, [chunk_id]))
+
+        hits.extend((expansion, score, trail) for expansion, (score, trail) in best.items())
+        hits.sort(key=itemgetter(1), reverse=True)
+        return hits
@@ -0,0 +1,20 @@
+"""Regular expressions and tokenisers shared by every pipeline stage."""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+ENTITY_PATTERN = re.compile(r"\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\b")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case ``text`` and split it into alphanumeric tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def find_entity_spans(text: str) -> List[str]:
+    """Return every capitalised n-gram in ``text`` in order of appearance."""
+    return ENTITY_PATTERN.findall(text)
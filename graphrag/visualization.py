@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Mapping, Optional, Sequence, Set
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
 
-import matplotlib
-
-# Use a non-interactive backend so rendering works in headless environments.
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
 
 from .graph_builder import Graph
 
@@ -27,6 +28,49 @@ EDGE_TYPE_COLORS: Mapping[str, str] = {
     "co_occurs": "#F59E0B",
 }
 
+# Shared by draw_graph and draw_graph_svg so the PNG and SVG outputs match.
+# Node sizes are matplotlib marker areas in points squared.
+_NODE_TYPE_SIZES: Mapping[str, float] = {"chunk": 650, "entity": 420}
+_NODE_TYPE_ALPHAS: Mapping[str, float] = {"chunk": 0.9, "entity": 0.75}
+_NODE_OUTLINE = "#1F2933"
+_EDGE_TYPE_WIDTHS: Mapping[str, float] = {"mentions": 1.5, "co_occurs": 1.0}
+_EDGE_ALPHA = 0.6
+_FOCUS_RING_SIZE = 700
+_FOCUS_RING_WIDTH = 2.6
+_INK = "#111827"  # focus rings and labels
+_LABEL_FONT_SIZE = 8
+
+
+# Above this many nodes the "spring" layout minimises the Fruchterman-Reingold
+# energy with L-BFGS instead of running NetworkX's force-directed iterations.
+LBFGS_SPRING_MIN_NODES = 500
+
+# Pairwise (row, column) entries the L-BFGS repulsion term handles at a time,
+# so its scratch arrays stay a few MB regardless of graph size.
+_REPULSION_BLOCK_PAIRS = 1 << 20
+
+# Weight of the pull towards the centroid in the L-BFGS energy. Repulsion
+# alone has no minimum for isolated nodes or separate components, which
+# would drift outwards and leave the connected part squashed after rescaling.
+_LBFGS_GRAVITY = 1.0
+
+
+_MPL_INIT = False
+
+
+def _pyplot():
+    """Import ``matplotlib.pyplot`` on first use so plain queries never load it."""
+    global _MPL_INIT
+    if not _MPL_INIT:
+        import matplotlib
+
+        # Use a non-interactive backend so rendering works in headless environments.
+        matplotlib.use("Agg")
+        _MPL_INIT = True
+    import matplotlib.pyplot as plt
+
+    return plt
+
 
 @dataclass(frozen=True)
 class VisualisationConfig:
@@ -46,41 +90,58 @@ def select_subgraph(
     max_nodes: int = 200,
     include_neighbors_radius: int = 2,
 ) -> Graph:
-    """Return a view of ``graph`` limited to ``max_nodes`` and optionally centred on ``focus_nodes``."""
+    """Return a copy of ``graph`` limited to ``max_nodes`` and optionally centred on ``focus_nodes``.
+
+    Without focus nodes, graphs larger than ``max_nodes`` keep their
+    highest-degree nodes so the snapshot shows the densest structure.
+    """
     if graph.number_of_nodes() == 0:
         raise ValueError("The supplied graph is empty – nothing to visualise.")
 
     if focus_nodes:
-        focus_set: Set[str] = set()
-        for node in focus_nodes:
-            if node not in graph:
-                continue
-            focus_set.add(node)
-            if include_neighbors_radius <= 0:
-                continue
-            reachable = nx.single_source_shortest_path_length(
-                graph, node, cutoff=include_neighbors_radius
-            ).keys()
-            focus_set.update(reachable)
-        if not focus_set:
+        # One multi-source BFS from every focus node, kept in discovery order.
+        reach: Dict[str, None] = dict.fromkeys(node for node in focus_nodes if node in graph)
+        if not reach:
             raise ValueError("None of the focus nodes exist in the graph.")
-        subgraph = graph.subgraph(focus_set)
+        frontier = list(reach)
+        for _ in range(include_neighbors_radius):
+            if len(reach) >= max_nodes:
+                break
+            next_frontier = []
+            for node in frontier:
+                for neighbor in graph.neighbors(node):
+                    if neighbor not in reach:
+                        reach[neighbor] = None
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        candidates: Iterable[str] = reach
+    elif graph.number_of_nodes() > max_nodes:
+        # No focus: keep the best-connected nodes (ties in graph order).
+        candidates = [
+            node for node, _ in heapq.nlargest(max_nodes, graph.degree, key=itemgetter(1))
+        ]
     else:
-        ordered_nodes = list(graph.nodes())
-        subgraph = graph.subgraph(ordered_nodes[:max_nodes])
-
-    if subgraph.number_of_nodes() > max_nodes:
-        limited_nodes = list(subgraph.nodes())[:max_nodes]
-        subgraph = subgraph.subgraph(limited_nodes)
-
-    # Ensure we return a new Graph object rather than a graph view.
-    return nx.Graph(subgraph)
+        candidates = graph.nodes()
+
+    # Cap first, then copy once; building the copy by hand keeps node order
+    # stable so seeded layouts are reproducible.
+    keep = dict.fromkeys(islice(candidates, max_nodes))
+    subgraph = graph.__class__()
+    subgraph.add_nodes_from((node, graph.nodes[node]) for node in keep)
+    subgraph.add_edges_from(
+        (u, v, data) for u, v, data in graph.edges(keep, data=True) if v in keep
+    )
+    return subgraph
 
 
 def compute_layout(graph: Graph, layout: str = "spring", seed: int = 42) -> Mapping[str, tuple[float, float]]:
     """Compute node positions for ``graph`` using the requested layout."""
     layout = layout.lower()
     if layout == "spring":
+        if graph.number_of_nodes() > LBFGS_SPRING_MIN_NODES:
+            return spring_layout_lbfgs(graph, seed=seed)
         return nx.spring_layout(graph, seed=seed)
     if layout == "kamada_kawai":
         return nx.kamada_kawai_layout(graph)
@@ -91,6 +152,65 @@ def compute_layout(graph: Graph, layout: str = "spring", seed: int = 42) -> Mapp
     raise ValueError(f"Unsupported layout '{layout}'. Choose from spring, kamada_kawai, spectral, shell.")
 
 
+def spring_layout_lbfgs(
+    graph: Graph, seed: int = 42, iterations: int = 50
+) -> Mapping[str, np.ndarray]:
+    """Spring layout found by minimising the Fruchterman-Reingold energy with L-BFGS.
+
+    The energy is ``sum(d**3) / (3k)`` over edges (attraction) minus
+    ``k**2 * sum(log d)`` over all node pairs (repulsion), with
+    ``k = 1 / sqrt(n)``, plus a weak ``sum(|x - centroid|**2)`` gravity that
+    keeps isolated nodes and components close. A quasi-Newton solver reaches a comparable layout
+    in far fewer steps than force-directed integration. Positions are
+    rescaled to ``[-1, 1]`` like :func:`networkx.spring_layout`.
+    """
+    from scipy.optimize import minimize
+
+    nodes = list(graph)
+    n = len(nodes)
+    if n < 2:
+        return nx.spring_layout(graph, seed=seed)
+    block = max(1, _REPULSION_BLOCK_PAIRS // n)
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None)
+    rows, cols = sp.triu(adjacency + adjacency.T, k=1).nonzero()
+    k = 1.0 / np.sqrt(n)
+
+    def energy(flat: np.ndarray) -> Tuple[float, np.ndarray]:
+        pos = flat.reshape(n, 2)
+        value = 0.0
+        grad = np.empty_like(pos)
+        # All-pairs repulsion, a block of rows at a time to bound memory.
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            delta = pos[start:stop, None, :] - pos[None, :, :]
+            dist2 = np.einsum("ijk,ijk->ij", delta, delta)
+            rows_in_block = np.arange(stop - start)
+            dist2[rows_in_block, rows_in_block + start] = 1.0
+            np.maximum(dist2, 1e-12, out=dist2)
+            # Every pair appears twice over all rows and log(d) = log(d**2) / 2.
+            value -= 0.25 * k * k * np.log(dist2).sum()
+            grad[start:stop] = -k * k * np.einsum("ijk,ij->ik", delta, 1.0 / dist2)
+
+        edge = pos[rows] - pos[cols]
+        length = np.sqrt(np.einsum("ij,ij->i", edge, edge))
+        value += (length**3).sum() / (3 * k)
+        force = edge * (length / k)[:, None]
+        np.add.at(grad, rows, force)
+        np.add.at(grad, cols, -force)
+
+        centred = pos - pos.mean(axis=0)
+        value += _LBFGS_GRAVITY * np.einsum("ij,ij->", centred, centred)
+        grad += 2 * _LBFGS_GRAVITY * centred
+        return value, grad.ravel()
+
+    start = np.random.default_rng(seed).random((n, 2))
+    result = minimize(
+        energy, start.ravel(), jac=True, method="L-BFGS-B", options={"maxiter": iterations}
+    )
+    positions = nx.rescale_layout(result.x.reshape(n, 2))
+    return dict(zip(nodes, positions))
+
+
 def draw_graph(
     graph: Graph,
     output_path: Path,
@@ -99,93 +219,53 @@ def draw_graph(
     focus_nodes: Optional[Sequence[str]] = None,
 ) -> Graph:
     """Render ``graph`` (or a subgraph) to ``output_path`` and return the rendered subgraph."""
-    subgraph = select_subgraph(
-        graph,
-        focus_nodes=focus_nodes,
-        max_nodes=config.max_nodes,
-        include_neighbors_radius=config.include_neighbors_radius,
-    )
-
-    positions = compute_layout(subgraph, layout=config.layout, seed=config.seed)
+    subgraph, positions = _snapshot(graph, config, focus_nodes)
+    nodes_by_type, edges_by_type = _bucket_by_type(subgraph)
+    focus_set = frozenset(focus_nodes or ())
 
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=_auto_size(subgraph.number_of_nodes()))
     ax.set_axis_off()
 
     # Draw edges grouped by type for clearer legends.
     for edge_type, color in EDGE_TYPE_COLORS.items():
-        edges = [
-            (u, v)
-            for u, v, data in subgraph.edges(data=True)
-            if data.get("type") == edge_type
-        ]
-        if not edges:
-            continue
-        nx.draw_networkx_edges(
-            subgraph,
-            pos=positions,
-            edgelist=edges,
-            edge_color=color,
-            width=1.5 if edge_type == "mentions" else 1.0,
-            alpha=0.6,
-            ax=ax,
-        )
+        edges = edges_by_type.get(edge_type)
+        if edges:
+            nx.draw_networkx_edges(
+                subgraph, pos=positions, edgelist=edges, edge_color=color,
+                width=_EDGE_TYPE_WIDTHS[edge_type], alpha=_EDGE_ALPHA, ax=ax,
+            )
 
     # Draw nodes by type.
-    focus_set = set(focus_nodes or [])
-    legend_handles = []
+    handles, legend_labels = [], []
     for node_type, color in NODE_TYPE_COLORS.items():
-        nodes = [
-            node for node, data in subgraph.nodes(data=True) if data.get("type") == node_type
-        ]
-        if not nodes:
-            continue
-        sizes = 650 if node_type == "chunk" else 420
-        collection = nx.draw_networkx_nodes(
-            subgraph,
-            pos=positions,
-            nodelist=nodes,
-            node_color=color,
-            node_size=sizes,
-            linewidths=1.0,
-            edgecolors="#1F2933",
-            alpha=0.9 if node_type == "chunk" else 0.75,
-            ax=ax,
-        )
-        legend_handles.append((collection, node_type.title()))
+        nodes = nodes_by_type.get(node_type)
+        if nodes:
+            collection = nx.draw_networkx_nodes(
+                subgraph, pos=positions, nodelist=nodes, node_color=color,
+                node_size=_NODE_TYPE_SIZES[node_type], linewidths=1.0,
+                edgecolors=_NODE_OUTLINE, alpha=_NODE_TYPE_ALPHAS[node_type], ax=ax,
+            )
+            handles.append(collection)
+            legend_labels.append(node_type.title())
 
     # Highlight focus nodes with a stronger border.
-    if focus_set:
-        highlight_nodes = [node for node in subgraph.nodes() if node in focus_set]
-        if highlight_nodes:
-            nx.draw_networkx_nodes(
-                subgraph,
-                pos=positions,
-                nodelist=highlight_nodes,
-                node_color="none",
-                node_size=700,
-                linewidths=2.6,
-                edgecolors="#111827",
-                ax=ax,
-            )
+    highlight_nodes = _focus_in(subgraph, focus_set)
+    if highlight_nodes:
+        nx.draw_networkx_nodes(
+            subgraph, pos=positions, nodelist=highlight_nodes, node_color="none",
+            node_size=_FOCUS_RING_SIZE, linewidths=_FOCUS_RING_WIDTH, edgecolors=_INK, ax=ax,
+        )
 
     if config.with_labels:
         labels = _build_labels(subgraph, focus_set=focus_set)
         nx.draw_networkx_labels(
-            subgraph,
-            pos=positions,
-            labels=labels,
-            font_size=8,
-            font_color="#111827",
-            ax=ax,
+            subgraph, pos=positions, labels=labels,
+            font_size=_LABEL_FONT_SIZE, font_color=_INK, ax=ax,
         )
 
-    if legend_handles:
-        ax.legend(
-            [handle for handle, _ in legend_handles],
-            [label for _, label in legend_handles],
-            loc="lower left",
-            frameon=False,
-        )
+    if handles:
+        ax.legend(handles, legend_labels, loc="lower left", frameon=False)
 
     fig.tight_layout()
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -194,6 +274,152 @@ def draw_graph(
     return subgraph
 
 
+def draw_graph_svg(
+    graph: Graph,
+    output_path: Path,
+    *,
+    config: VisualisationConfig,
+    focus_nodes: Optional[Sequence[str]] = None,
+) -> Graph:
+    """Like :func:`draw_graph`, but write SVG markup directly without matplotlib.
+
+    Each edge type becomes one ``<path>`` and each node one ``<circle>``, so
+    the cost is a string format per element instead of a matplotlib artist
+    per element. This is much faster and smaller for snapshots with
+    thousands of nodes. Colours and sizes follow :func:`draw_graph`.
+    """
+    subgraph, positions = _snapshot(graph, config, focus_nodes)
+    nodes_by_type, edges_by_type = _bucket_by_type(subgraph)
+    focus_set = frozenset(focus_nodes or ())
+
+    # Sizes are in points, matching matplotlib's figure size and node areas.
+    width, height = (72 * inches for inches in _auto_size(subgraph.number_of_nodes()))
+    points = _svg_points(subgraph, positions, width, height)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}pt" height="{height:g}pt" '
+        f'viewBox="0 0 {width:g} {height:g}">',
+        f'<rect width="{width:g}" height="{height:g}" fill="white"/>',
+    ]
+    parts.extend(_svg_edges(edges_by_type, points))
+    for node_type, color in NODE_TYPE_COLORS.items():
+        nodes = nodes_by_type.get(node_type)
+        if nodes:
+            parts.append(
+                f'<g fill="{color}" fill-opacity="{_NODE_TYPE_ALPHAS[node_type]}" stroke="{_NODE_OUTLINE}">'
+            )
+            parts.extend(_svg_circles(nodes, points, _NODE_TYPE_SIZES[node_type]))
+            parts.append("</g>")
+    highlight_nodes = _focus_in(subgraph, focus_set)
+    if highlight_nodes:
+        parts.append(f'<g fill="none" stroke="{_INK}" stroke-width="{_FOCUS_RING_WIDTH}">')
+        parts.extend(_svg_circles(highlight_nodes, points, _FOCUS_RING_SIZE))
+        parts.append("</g>")
+    parts.extend(_svg_legend(nodes_by_type, height))
+    if config.with_labels:
+        parts.extend(_svg_labels(_build_labels(subgraph, focus_set=focus_set), points))
+    parts.append("</svg>")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(parts) + "\n", encoding="utf-8")
+    return subgraph
+
+
+def _snapshot(
+    graph: Graph, config: VisualisationConfig, focus_nodes: Optional[Sequence[str]]
+) -> Tuple[Graph, Mapping[str, tuple[float, float]]]:
+    """Select the subgraph to render and lay it out."""
+    subgraph = select_subgraph(
+        graph,
+        focus_nodes=focus_nodes,
+        max_nodes=config.max_nodes,
+        include_neighbors_radius=config.include_neighbors_radius,
+    )
+    return subgraph, compute_layout(subgraph, layout=config.layout, seed=config.seed)
+
+
+def _bucket_by_type(
+    graph: Graph,
+) -> Tuple[Dict[Optional[str], List[str]], Dict[Optional[str], List[Tuple[str, str]]]]:
+    """Group nodes and edges by their ``type`` attribute, one pass each."""
+    nodes_by_type: Dict[Optional[str], List[str]] = defaultdict(list)
+    for node, data in graph.nodes(data=True):
+        nodes_by_type[data.get("type")].append(node)
+    edges_by_type: Dict[Optional[str], List[Tuple[str, str]]] = defaultdict(list)
+    for u, v, data in graph.edges(data=True):
+        edges_by_type[data.get("type")].append((u, v))
+    return nodes_by_type, edges_by_type
+
+
+def _focus_in(graph: Graph, focus_set: AbstractSet[str]) -> List[str]:
+    return [node for node in graph.nodes() if node in focus_set] if focus_set else []
+
+
+def _svg_points(
+    graph: Graph, positions: Mapping[str, tuple[float, float]], width: float, height: float
+) -> Dict[str, Tuple[float, float]]:
+    """Map layout positions onto the SVG canvas, leaving room for the largest node."""
+    margin = 36.0
+    coords = np.array([positions[node] for node in graph], dtype=float).reshape(-1, 2)
+    low, high = coords.min(axis=0), coords.max(axis=0)
+    span = np.where(high > low, high - low, 1.0)
+    scale = np.array([width - 2 * margin, height - 2 * margin]) / span
+    # SVG's y axis points down; flip it so the picture matches draw_graph.
+    return {
+        node: (margin + (x - low[0]) * scale[0], height - margin - (y - low[1]) * scale[1])
+        for node, (x, y) in zip(graph, coords)
+    }
+
+
+def _svg_edges(
+    edges_by_type: Mapping[Optional[str], List[Tuple[str, str]]],
+    points: Mapping[str, Tuple[float, float]],
+) -> Iterator[str]:
+    """One ``<path>`` per edge type."""
+    for edge_type, color in EDGE_TYPE_COLORS.items():
+        edges = edges_by_type.get(edge_type)
+        if edges:
+            path = "".join(
+                "M{:.1f} {:.1f}L{:.1f} {:.1f}".format(*points[u], *points[v]) for u, v in edges
+            )
+            yield (
+                f'<path d="{path}" stroke="{color}" stroke-width="{_EDGE_TYPE_WIDTHS[edge_type]}" '
+                f'stroke-opacity="{_EDGE_ALPHA}" fill="none"/>'
+            )
+
+
+def _svg_circles(
+    nodes: Iterable[str], points: Mapping[str, Tuple[float, float]], size: float
+) -> Iterator[str]:
+    """One ``<circle>`` per node, sized like a matplotlib marker of area ``size``."""
+    radius = np.sqrt(size / np.pi)
+    for node in nodes:
+        yield f'<circle cx="{points[node][0]:.1f}" cy="{points[node][1]:.1f}" r="{radius:.1f}"/>'
+
+
+def _svg_legend(nodes_by_type: Mapping[Optional[str], List[str]], height: float) -> Iterator[str]:
+    legend_y = height - 12.0
+    for node_type, color in NODE_TYPE_COLORS.items():
+        if nodes_by_type.get(node_type):
+            yield (
+                f'<circle cx="16" cy="{legend_y - 4:g}" r="5" fill="{color}" stroke="{_NODE_OUTLINE}"/>'
+                f'<text x="26" y="{legend_y:g}" font-size="10">{node_type.title()}</text>'
+            )
+            legend_y -= 16.0
+
+
+def _svg_labels(
+    labels: Mapping[str, str], points: Mapping[str, Tuple[float, float]]
+) -> Iterator[str]:
+    yield (
+        f'<g font-size="{_LABEL_FONT_SIZE}" fill="{_INK}" '
+        'text-anchor="middle" dominant-baseline="central">'
+    )
+    for node, label in labels.items():
+        yield f'<text x="{points[node][0]:.1f}" y="{points[node][1]:.1f}">{escape(label)}</text>'
+    yield "</g>"
+
+
 def _auto_size(node_count: int) -> tuple[float, float]:
     """Heuristically choose a figure size based on node count."""
     if node_count < 40:
@@ -203,7 +429,7 @@ def _auto_size(node_count: int) -> tuple[float, float]:
     return (12, 10)
 
 
-def _build_labels(graph: Graph, *, focus_set: Set[str]) -> Mapping[str, str]:
+def _build_labels(graph: Graph, *, focus_set: AbstractSet[str]) -> Mapping[str, str]:
     """Choose human-readable labels for nodes, prioritising focus nodes."""
     labels: dict[str, str] = {}
     for node, data in graph.nodes(data=True):
@@ -222,6 +448,8 @@ def _build_labels(graph: Graph, *, focus_set: Set[str]) -> Mapping[str, str]:
 __all__ = [
     "VisualisationConfig",
     "draw_graph",
+    "draw_graph_svg",
     "select_subgraph",
     "compute_layout",
+    "spring_layout_lbfgs",
 ]
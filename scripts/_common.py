@@ -0,0 +1,129 @@
+"""Argument and pipeline helpers shared by the CLI scripts.
+
+Nothing here imports ``graphrag`` at module level, so parsing arguments
+(including ``--help``) stays fast; :func:`lazy_pipeline_from` pulls the
+package in only once a pipeline is actually needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from graphrag import GraphRAGPipeline
+
+
+def add_data_path_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "data_path",
+        type=Path,
+        help="Path to directory or file containing source documents.",
+    )
+
+
+def add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory holding cached pipeline artefacts (default: ~/.cache/graphrag).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild from scratch without reading or writing the cache.",
+    )
+
+
+def add_build_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for embedding large corpora (default: every CPU).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=512,
+        help="Chunks handed to an embedding worker at a time.",
+    )
+
+
+def add_gemini_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--use-gemini",
+        action="store_true",
+        help="Use Google Gemini to synthesise the answer text.",
+    )
+    parser.add_argument(
+        "--gemini-api-key",
+        type=str,
+        default=None,
+        help="Explicit Gemini API key. Defaults to the GOOGLE_GEMINI_API_KEY env var.",
+    )
+    parser.add_argument(
+        "--gemini-model",
+        type=str,
+        default="models/gemini-1.5-flash",
+        help="Gemini model name to invoke when --use-gemini is set.",
+    )
+    parser.add_argument(
+        "--gemini-temperature",
+        type=float,
+        default=0.2,
+        help="Sampling temperature for Gemini responses.",
+    )
+    parser.add_argument(
+        "--gemini-max-output-tokens",
+        type=int,
+        default=512,
+        help="Maximum output tokens for Gemini responses.",
+    )
+    parser.add_argument(
+        "--gemini-env-var",
+        type=str,
+        default="GOOGLE_GEMINI_API_KEY",
+        help="Environment variable to read the Gemini API key from when not provided.",
+    )
+
+
+def gemini_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Keyword arguments for the pipeline's ``*_with_gemini`` methods."""
+    return {
+        "api_key": args.gemini_api_key,
+        "model": args.gemini_model,
+        "temperature": args.gemini_temperature,
+        "max_output_tokens": args.gemini_max_output_tokens,
+        "env_var": args.gemini_env_var,
+    }
+
+
+def lazy_pipeline_from(
+    args: argparse.Namespace, *, shape_only: bool = False
+) -> "GraphRAGPipeline":
+    """Import ``graphrag`` and build (or load from cache) the pipeline for ``args``.
+
+    The source files are listed once, up front: an empty corpus exits with
+    a message instead of failing deep inside the pipeline, and the same list
+    feeds both the cache key and the loader. ``shape_only`` reuses a cached
+    full build if there is one and otherwise builds the graph without
+    embeddings, which is never cached.
+    """
+    from graphrag import GraphRAGPipeline
+    from graphrag.data_loader import SUPPORTED_EXTENSIONS, iter_source_files
+    from graphrag.pipeline import DEFAULT_CACHE_DIR
+
+    files = list(iter_source_files(args.data_path))
+    if not files:
+        extensions = ", ".join(sorted(SUPPORTED_EXTENSIONS))
+        raise SystemExit(f"No source documents ({extensions}) found under {args.data_path}.")
+    return GraphRAGPipeline.from_files(
+        files,
+        cache_dir=None if args.no_cache else args.cache_dir or DEFAULT_CACHE_DIR,
+        shape_only=shape_only,
+        jobs=args.jobs,
+        batch_size=args.batch_size,
+    )
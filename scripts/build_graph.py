@@ -3,34 +3,59 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+# graphrag itself is imported lazily, so --help and usage errors skip the heavy imports.
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from graphrag import GraphRAGPipeline
+from scripts._common import (
+    add_build_args,
+    add_cache_args,
+    add_data_path_arg,
+    lazy_pipeline_from,
+)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build GraphRAG artefacts and show summary.")
-    parser.add_argument("data_path", type=Path, help="Path to directory or file containing source documents.")
-    parser.add_argument("--export-graphml", type=Path, help="Optional path to write a GraphML snapshot.")
-    return parser.parse_args()
+    add_data_path_arg(parser)
+    parser.add_argument("--export-graphml", type=Path, help="Optional path to write a GraphML snapshot (add .gz to compress).")
+    parser.add_argument("--export-pickle", type=Path, help="Optional path to write a pickled graph for fast reloading.")
+    parser.add_argument("--summary-only", action="store_true", help="Skip embeddings and only build what the summary and exports need.")
+    add_build_args(parser)
+    add_cache_args(parser)
+    args = parser.parse_args()
+    # Checked up front so a missing optional package fails before the build, not after.
+    if (
+        args.export_graphml is not None
+        and args.export_graphml.suffix == ".zst"
+        and importlib.util.find_spec("zstandard") is None
+    ):
+        parser.error("--export-graphml: .zst output needs zstandard (pip install zstandard)")
+    return args
 
 
 def main() -> None:
     args = parse_args()
-    pipeline = GraphRAGPipeline.from_path(args.data_path)
+    pipeline = lazy_pipeline_from(args, shape_only=args.summary_only)
     summary = pipeline.explain_graph()
     print(summary)
 
     if args.export_graphml:
-        graph = pipeline.artifacts.graph
-        import networkx as nx_module
+        from graphrag.export import write_graphml
 
-        nx_module.write_graphml(graph, args.export_graphml)
+        write_graphml(pipeline.artifacts.graph, args.export_graphml)
         print(f"Graph written to {args.export_graphml}")
 
+    if args.export_pickle:
+        from graphrag.export import write_graph_pickle
+
+        write_graph_pickle(pipeline.artifacts.graph, args.export_pickle)
+        print(f"Graph written to {args.export_pickle}")
+
 
 if __name__ == "__main__":
     main()
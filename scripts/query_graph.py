@@ -3,69 +3,106 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
 import sys
+from typing import List
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+# graphrag itself is imported lazily, so --help and usage errors skip the heavy imports.
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from graphrag import GraphRAGPipeline
+from scripts._common import (
+    add_build_args,
+    add_cache_args,
+    add_data_path_arg,
+    add_gemini_args,
+    gemini_options,
+    lazy_pipeline_from,
+)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Query a GraphRAG pipeline.")
-    parser.add_argument("data_path", type=Path, help="Path to source documents.")
-    parser.add_argument("question", type=str, help="Natural language question to ask.")
-    parser.add_argument("--top-k", type=int, default=3, help="Number of contexts to return.")
+    add_data_path_arg(parser)
     parser.add_argument(
-        "--use-gemini",
-        action="store_true",
-        help="Use Google Gemini to synthesise the answer text.",
+        "question", type=str, nargs="?", help="Natural language question to ask."
     )
     parser.add_argument(
-        "--gemini-api-key",
-        type=str,
+        "--query-file",
+        type=Path,
         default=None,
-        help="Explicit Gemini API key. Defaults to the GOOGLE_GEMINI_API_KEY env var.",
-    )
-    parser.add_argument(
-        "--gemini-model",
-        type=str,
-        default="models/gemini-1.5-flash",
-        help="Gemini model name to invoke when --use-gemini is set.",
+        help=(
+            "Answer every question in this file (one per line, or JSONL objects with a "
+            '"question" key) and print one JSON result per line.'
+        ),
     )
     parser.add_argument(
-        "--gemini-temperature",
-        type=float,
-        default=0.2,
-        help="Sampling temperature for Gemini responses.",
-    )
-    parser.add_argument(
-        "--gemini-max-output-tokens",
+        "--workers",
         type=int,
-        default=512,
-        help="Maximum output tokens for Gemini responses.",
+        default=1,
+        help="Processes to spread --query-file retrieval over (0 uses every CPU).",
     )
-    parser.add_argument(
-        "--gemini-env-var",
-        type=str,
-        default="GOOGLE_GEMINI_API_KEY",
-        help="Environment variable to read the Gemini API key from when not provided.",
-    )
-    return parser.parse_args()
+    parser.add_argument("--top-k", type=int, default=3, help="Number of contexts to return.")
+    add_gemini_args(parser)
+    add_build_args(parser)
+    add_cache_args(parser)
+    args = parser.parse_args()
+    if (args.question is None) == (args.query_file is None):
+        parser.error("provide either a question or --query-file, but not both")
+    if args.query_file is not None:
+        # Read up front so a bad file is reported before the pipeline is built.
+        try:
+            args.questions = read_questions(args.query_file)
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            parser.error(f"--query-file: {exc}")
+    return args
+
+
+def read_questions(path: Path) -> List[str]:
+    """Read questions from ``path``, skipping blank lines.
+
+    Lines holding a JSON object contribute its ``"question"`` string; any
+    other line, including one that merely starts with ``{``, is taken
+    verbatim. Raises ``ValueError`` naming the line for a JSON object
+    without a usable question.
+    """
+    questions = []
+    for lineno, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            if record is not None:
+                question = record.get("question")
+                if not isinstance(question, str) or not question.strip():
+                    raise ValueError(f"{path}:{lineno}: JSON record has no \"question\" string")
+                line = question
+        questions.append(line)
+    return questions
 
 
 def main() -> None:
     args = parse_args()
-    pipeline = GraphRAGPipeline.from_path(args.data_path)
+    pipeline = lazy_pipeline_from(args)
+    if args.query_file is not None:
+        questions = args.questions
+        if args.use_gemini:
+            records = pipeline.query_batch_with_gemini(
+                questions, top_k=args.top_k, workers=args.workers, **gemini_options(args)
+            )
+        else:
+            records = pipeline.query_batch(questions, top_k=args.top_k, workers=args.workers)
+        for record in records:
+            print(json.dumps(record, ensure_ascii=False))
+        return
     if args.use_gemini:
         response = pipeline.query_with_gemini(
-            args.question,
-            top_k=args.top_k,
-            api_key=args.gemini_api_key,
-            model=args.gemini_model,
-            temperature=args.gemini_temperature,
-            max_output_tokens=args.gemini_max_output_tokens,
-            env_var=args.gemini_env_var,
+            args.question, top_k=args.top_k, **gemini_options(args)
         )
     else:
         response = pipeline.query(args.question, top_k=args.top_k)
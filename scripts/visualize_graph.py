@@ -3,29 +3,49 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 from pathlib import Path
 import sys
+import tempfile
+from typing import TYPE_CHECKING, Dict, List
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+# graphrag itself is imported lazily, so --help and usage errors skip the heavy imports.
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from graphrag import GraphRAGPipeline
-from graphrag.visualization import VisualisationConfig, draw_graph
+from scripts._common import (
+    add_build_args,
+    add_cache_args,
+    add_data_path_arg,
+    lazy_pipeline_from,
+)
+
+if TYPE_CHECKING:
+    from graphrag import GraphRAGPipeline
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Render the GraphRAG knowledge graph as an image."
     )
-    parser.add_argument(
-        "data_path",
-        type=Path,
-        help="Path to directory or file containing source documents.",
-    )
+    add_data_path_arg(parser)
     parser.add_argument(
         "--output",
         type=Path,
         default=Path("graphrag_graph.png"),
-        help="Path to write the rendered image (PNG). Defaults to graphrag_graph.png.",
+        help="Path to write the rendered image. Defaults to graphrag_graph.png.",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default=None,
+        choices=["png", "svg"],
+        help=(
+            "Image format. svg is written directly without matplotlib, which is much "
+            "faster for large graphs. Defaults to the --output extension, else png."
+        ),
     )
     parser.add_argument(
         "--layout",
@@ -63,22 +83,75 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Render node labels (chunk doc IDs and entity names).",
     )
+    add_build_args(parser)
+    add_cache_args(parser)
     return parser.parse_args()
 
 
+def focus_nodes_for(pipeline: "GraphRAGPipeline", question: str, top_k: int) -> List[str]:
+    """Return the retrieved chunks for ``question``, then the rest of their trails."""
+    # Ordered sets: retrieved chunks first, then the remaining trail nodes.
+    seen: Dict[str, None] = {}
+    trail_nodes: Dict[str, None] = {}
+    for result in pipeline.iter_retrieve(question, top_k=top_k):
+        seen.setdefault(result.chunk_id, None)
+        for node in result.trail:
+            trail_nodes.setdefault(node, None)
+    seen.update(trail_nodes)
+    return list(seen)
+
+
+def cached_focus_nodes(
+    pipeline: "GraphRAGPipeline", question: str, top_k: int, cache_dir: Path
+) -> List[str]:
+    """Like :func:`focus_nodes_for`, memoised in a JSON file under ``cache_dir``.
+
+    The key covers the corpus (the pipeline's manifest digest), the question
+    and ``top_k``, so re-rendering with a different layout or node budget
+    skips retrieval. Pipelines built without the artefact cache have no
+    digest and always retrieve afresh.
+    """
+    if pipeline.source_digest is None:
+        return focus_nodes_for(pipeline, question, top_k)
+
+    key = hashlib.sha1(f"{pipeline.source_digest}\0{question}\0{top_k}".encode()).hexdigest()
+    cache_file = Path(cache_dir).expanduser() / f"focus_{key}.json"
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+
+    focus_nodes = focus_nodes_for(pipeline, question, top_k)
+    # Best effort: an unwritable cache must not cost the render. The temporary
+    # file plus os.replace keeps concurrent readers from seeing partial JSON.
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(focus_nodes, handle)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+    return focus_nodes
+
+
 def main() -> None:
     args = parse_args()
-    pipeline = GraphRAGPipeline.from_path(args.data_path)
+    from graphrag.pipeline import DEFAULT_CACHE_DIR
+    from graphrag.visualization import VisualisationConfig, draw_graph, draw_graph_svg
+
+    pipeline = lazy_pipeline_from(args)
     graph = pipeline.artifacts.graph
 
     focus_nodes = None
     if args.focus_question:
-        results = pipeline.retrieve(args.focus_question, top_k=args.top_k)
-        trail_nodes = []
-        for result in results:
-            trail_nodes.extend(result.trail)
-        chunk_ids = [result.chunk_id for result in results]
-        focus_nodes = list(dict.fromkeys(chunk_ids + trail_nodes))
+        focus_nodes = cached_focus_nodes(
+            pipeline, args.focus_question, args.top_k, args.cache_dir or DEFAULT_CACHE_DIR
+        )
         if not focus_nodes:
             print("No focus nodes identified from the retrieval results.")
         else:
@@ -91,7 +164,9 @@ def main() -> None:
         with_labels=args.with_labels,
     )
 
-    rendered = draw_graph(
+    image_format = args.format or ("svg" if args.output.suffix.lower() == ".svg" else "png")
+    render = draw_graph_svg if image_format == "svg" else draw_graph
+    rendered = render(
         graph,
         args.output,
         config=config,
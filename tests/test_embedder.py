@@ -0,0 +1,113 @@
+import math
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from graphrag.chunker import Chunk
+from graphrag.embedder import BagOfWordsEmbedder, tokenize
+
+DOCS = [
+    "Graphs link entities and chunks.",
+    "Knowledge graphs help retrieval; retrieval ranks chunks.",
+    "Entities appear in chunks, chunks appear in documents.",
+]
+
+
+def reference_tfidf(documents, text):
+    """The original pure-Python formula, as a ``token -> weight`` dict."""
+    doc_tokens = [set(tokenize(doc)) for doc in documents]
+    idf = {
+        token: math.log(1 + len(doc_tokens) / (1 + sum(token in tokens for tokens in doc_tokens)))
+        for token in set().union(*doc_tokens)
+    }
+    counts = Counter(tokenize(text))
+    max_count = max(counts.values(), default=1)
+    return {
+        token: (0.5 + 0.5 * count / max_count) * idf[token]
+        for token, count in counts.items()
+        if token in idf
+    }
+
+
+def as_weights(embedder, vector):
+    return {token: vector[idx] for token, idx in embedder.vocabulary.items() if vector[idx]}
+
+
+class TfidfParityTest(unittest.TestCase):
+    def setUp(self):
+        self.embedder = BagOfWordsEmbedder()
+        self.embedder.fit(DOCS)
+
+    def test_transform_matches_reference(self):
+        for text in DOCS + ["retrieval of unseen words"]:
+            expected = reference_tfidf(DOCS, text)
+            actual = as_weights(self.embedder, self.embedder.transform(text))
+            self.assertEqual(actual.keys(), expected.keys())
+            for token, weight in expected.items():
+                self.assertAlmostEqual(actual[token], weight, places=12)
+
+    def test_transform_many_matches_transform(self):
+        matrix = self.embedder.transform_many(DOCS).toarray()
+        expected = np.vstack([self.embedder.transform(doc) for doc in DOCS])
+        np.testing.assert_allclose(matrix, expected, rtol=1e-6)
+
+    def test_tokens_and_text_agree(self):
+        for doc in DOCS:
+            np.testing.assert_array_equal(
+                self.embedder.transform(tokenize(doc)), self.embedder.transform(doc)
+            )
+
+    def test_fit_transform_chunks_keys_rows_by_chunk_id(self):
+        chunks = [Chunk(chunk_id=f"doc::chunk-{i}", doc_id="doc", text=text) for i, text in enumerate(DOCS)]
+        embedder = BagOfWordsEmbedder()
+        store = embedder.fit_transform_chunks(chunks)
+        self.assertEqual(store.ids, [chunk.chunk_id for chunk in chunks])
+        self.assertEqual(store.id_to_row, {chunk.chunk_id: i for i, chunk in enumerate(chunks)})
+        self.assertEqual(store.matrix.shape, (len(DOCS), len(embedder.vocabulary)))
+
+
+class EmptyCorpusTest(unittest.TestCase):
+    def test_fit_on_nothing(self):
+        embedder = BagOfWordsEmbedder()
+        embedder.fit([])
+        self.assertEqual(embedder.vocabulary, {})
+        self.assertEqual(embedder.transform("anything at all").shape, (0,))
+        self.assertEqual(embedder.transform_many(["a", "b"]).shape, (2, 0))
+
+    def test_transform_before_fit_raises(self):
+        with self.assertRaises(RuntimeError):
+            BagOfWordsEmbedder().transform("graphs")
+
+
+class FeatureSelectionTest(unittest.TestCase):
+    # "chunks" is in all three documents, "entities" and "graphs" in two.
+    def test_min_df_count(self):
+        embedder = BagOfWordsEmbedder(min_df=2)
+        embedder.fit(DOCS)
+        self.assertEqual(set(embedder.vocabulary), {"chunks", "entities", "graphs"})
+
+    def test_max_df_fraction(self):
+        embedder = BagOfWordsEmbedder(max_df=0.9)
+        embedder.fit(DOCS)
+        self.assertNotIn("chunks", embedder.vocabulary)
+        self.assertIn("graphs", embedder.vocabulary)
+
+    def test_max_features_keeps_most_frequent(self):
+        embedder = BagOfWordsEmbedder(max_features=1)
+        embedder.fit(DOCS)
+        self.assertEqual(list(embedder.vocabulary), ["chunks"])
+        self.assertEqual(embedder.idf.shape, (1,))
+
+    def test_vocabulary_ids_are_dense(self):
+        embedder = BagOfWordsEmbedder(min_df=2)
+        embedder.fit(DOCS)
+        self.assertEqual(sorted(embedder.vocabulary.values()), list(range(len(embedder.vocabulary))))
+
+    def test_conflicting_limits_rejected(self):
+        with self.assertRaises(ValueError):
+            BagOfWordsEmbedder(min_df=3, max_df=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
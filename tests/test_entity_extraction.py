@@ -0,0 +1,78 @@
+import unittest
+from collections import Counter
+from itertools import combinations
+
+from graphrag.chunker import Chunk
+from graphrag.entity_extraction import (
+    extract_entities,
+    extract_entities_and_relations,
+    extract_relations,
+    map_mentions,
+)
+
+TEXTS = [
+    "Alice met Bob in Paris. Alice later wrote to Bob.",
+    "Bob visited Paris with Carol.",
+    "Alice and Carol studied Graph Theory.",
+    "Dave stayed home.",
+    "Graph Theory links Alice, Bob and Carol.",
+]
+
+
+def make_chunks(texts):
+    return [Chunk(chunk_id=f"doc::chunk-{i}", doc_id="doc", text=text) for i, text in enumerate(texts)]
+
+
+def pair_counts(mentions):
+    """Count co-occurring entity pairs the slow way, one chunk at a time."""
+    counts = Counter()
+    for entity_ids in mentions.values():
+        counts.update(tuple(sorted(pair)) for pair in combinations(set(entity_ids), 2))
+    return counts
+
+
+class EntityTest(unittest.TestCase):
+    def test_min_freq_filters_rare_spans(self):
+        entities = extract_entities(make_chunks(TEXTS), min_freq=2)
+        self.assertIn("graph_theory", entities)
+        self.assertNotIn("dave", entities)
+        self.assertEqual(entities["alice"].frequency, 4)
+
+    def test_mentions_list_each_entity_once_in_order(self):
+        chunks = make_chunks(TEXTS)
+        mentions = map_mentions(chunks, extract_entities(chunks))
+        self.assertEqual(mentions["doc::chunk-0"], ["alice", "bob", "paris"])
+        self.assertEqual(mentions["doc::chunk-3"], [])
+
+
+class CoOccurrenceTest(unittest.TestCase):
+    def test_weights_match_pairwise_counts(self):
+        extraction = extract_entities_and_relations(make_chunks(TEXTS))
+        weights = {(r.head_id, r.tail_id): r.weight for r in extraction.relations}
+        self.assertEqual(weights, dict(pair_counts(extraction.mentions)))
+        self.assertEqual(weights[("alice", "bob")], 2.0)
+
+    def test_relations_are_ordered_pairs_without_self_loops(self):
+        for relation in extract_entities_and_relations(make_chunks(TEXTS)).relations:
+            self.assertLess(relation.head_id, relation.tail_id)
+
+    def test_single_pass_matches_separate_calls(self):
+        chunks = make_chunks(TEXTS)
+        entities = extract_entities(chunks)
+        extraction = extract_entities_and_relations(chunks)
+        self.assertEqual(extraction.entities, entities)
+        self.assertEqual(extraction.mentions, map_mentions(chunks, entities))
+        key = lambda r: (r.head_id, r.tail_id)
+        self.assertEqual(
+            sorted(extraction.relations, key=key),
+            sorted(extract_relations(chunks, entities), key=key),
+        )
+
+    def test_no_entities_means_no_relations(self):
+        extraction = extract_entities_and_relations(make_chunks(["nothing capitalised here"]))
+        self.assertEqual(extraction.entities, {})
+        self.assertEqual(extraction.relations, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+from graphrag.export import read_graph_pickle, write_graph_pickle
+
+
+def sample_graph():
+    graph = nx.Graph()
+    graph.add_node("doc::chunk-0", type="chunk", text="Alice met Bob.", vector=np.arange(64, dtype=np.float32))
+    graph.add_node("alice", type="entity", label="Alice", frequency=2)
+    graph.add_node("bob", type="entity", label="Bob", frequency=2)
+    graph.add_edge("doc::chunk-0", "alice", type="mentions", weight=1.0)
+    graph.add_edge("alice", "bob", type="co_occurs", weight=2.0, embedding=np.ones(8))
+    return graph
+
+
+class GraphPickleTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name, "graph.pkl")
+
+    def test_round_trip(self):
+        graph = sample_graph()
+        write_graph_pickle(graph, self.path)
+        loaded = read_graph_pickle(self.path)
+        self.assertEqual(list(loaded.nodes), list(graph.nodes))
+        self.assertEqual(list(loaded.edges), list(graph.edges))
+        self.assertEqual(loaded.nodes["alice"], graph.nodes["alice"])
+        np.testing.assert_array_equal(loaded.nodes["doc::chunk-0"]["vector"], np.arange(64))
+        np.testing.assert_array_equal(loaded.edges["alice", "bob"]["embedding"], np.ones(8))
+
+    def test_round_trip_without_buffers(self):
+        graph = nx.path_graph(3)
+        write_graph_pickle(graph, self.path)
+        self.assertTrue(nx.utils.graphs_equal(read_graph_pickle(self.path), graph))
+
+    def test_truncated_file_raises(self):
+        write_graph_pickle(sample_graph(), self.path)
+        data = self.path.read_bytes()
+        # The two arrays add 320 bytes of out-of-band buffers; 400 also cuts into the payload.
+        for cut in (1, 100, 400):
+            with self.subTest(cut=cut):
+                self.path.write_bytes(data[:-cut])
+                with self.assertRaises(ValueError):
+                    read_graph_pickle(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
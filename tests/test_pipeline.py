@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from graphrag import pipeline as pipeline_module
+from graphrag.pipeline import GraphRAGPipeline, manifest_digest
+
+DOC = "Alice met Bob in Paris. Bob and Alice talked about knowledge graphs in Paris.\n"
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.corpus = Path(tmp.name, "corpus")
+        self.corpus.mkdir()
+        self.doc = self.corpus / "doc.txt"
+        self.doc.write_text(DOC, encoding="utf-8")
+        self.cache_dir = Path(tmp.name, "cache")
+
+    def build(self, **kwargs):
+        return GraphRAGPipeline.from_path(self.corpus, cache_dir=self.cache_dir, **kwargs)
+
+    def entries(self):
+        return sorted(self.cache_dir.glob("*.pkl"))
+
+    def test_digest_tracks_edits_and_new_files(self):
+        before = manifest_digest([self.doc])
+        self.assertEqual(manifest_digest([self.doc]), before)
+        stat = self.doc.stat()
+        os.utime(self.doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        edited = manifest_digest([self.doc])
+        self.assertNotEqual(edited, before)
+        other = self.corpus / "other.txt"
+        other.write_text(DOC, encoding="utf-8")
+        self.assertNotEqual(manifest_digest([self.doc, other]), edited)
+
+    def test_second_build_is_served_from_cache(self):
+        first = self.build()
+        self.assertEqual(len(self.entries()), 1)
+        with mock.patch.object(pipeline_module, "_build_artifacts", side_effect=AssertionError):
+            second = self.build()
+        self.assertEqual(second.source_digest, first.source_digest)
+        self.assertEqual(
+            [r.chunk_id for r in second.retrieve("Paris")],
+            [r.chunk_id for r in first.retrieve("Paris")],
+        )
+
+    def test_edit_rebuilds_and_replaces_stale_entry(self):
+        first = self.build()
+        self.doc.write_text(DOC + "Carol joined them later.\n", encoding="utf-8")
+        second = self.build()
+        self.assertNotEqual(second.source_digest, first.source_digest)
+        entries = self.entries()
+        self.assertEqual(len(entries), 1)
+        self.assertIn(second.source_digest, entries[0].name)
+        self.assertIn("Carol", second.artifacts.chunks[0].text)
+
+    def test_shape_only_is_not_cached(self):
+        pipeline = self.build(shape_only=True)
+        self.assertEqual(self.entries(), [])
+        with self.assertRaises(RuntimeError):
+            pipeline.retrieve("Paris")
+
+    def test_unwritable_cache_warns_and_still_builds(self):
+        blocker = self.cache_dir.parent / "not-a-directory"
+        blocker.write_text("", encoding="utf-8")
+        with self.assertWarns(UserWarning):
+            pipeline = GraphRAGPipeline.from_path(self.corpus, cache_dir=blocker)
+        self.assertTrue(pipeline.retrieve("Paris"))
+
+    def test_corrupt_entry_is_rebuilt(self):
+        self.build()
+        (entry,) = self.entries()
+        entry.write_bytes(b"not a pickle")
+        pipeline = self.build()
+        self.assertTrue(pipeline.retrieve("Paris"))
+
+
+if __name__ == "__main__":
+    unittest.main()
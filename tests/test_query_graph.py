@@ -0,0 +1,38 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.query_graph import read_questions
+
+
+class ReadQuestionsTest(unittest.TestCase):
+    def read(self, text):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "questions.txt")
+            path.write_text(text, encoding="utf-8")
+            return read_questions(path)
+
+    def test_plain_lines_and_blank_lines(self):
+        self.assertEqual(
+            self.read("What is GraphRAG?\n\n   \nHow are chunks linked?  \n"),
+            ["What is GraphRAG?", "How are chunks linked?"],
+        )
+
+    def test_jsonl_records(self):
+        self.assertEqual(
+            self.read('{"question": "What is GraphRAG?", "id": 1}\nPlain question\n'),
+            ["What is GraphRAG?", "Plain question"],
+        )
+
+    def test_brace_led_line_that_is_not_json_is_kept(self):
+        self.assertEqual(self.read("{curly} braces in a question?\n"), ["{curly} braces in a question?"])
+
+    def test_json_record_without_question_names_the_line(self):
+        for record in ('{"id": 3}', '{"question": ""}', '{"question": 42}'):
+            with self.subTest(record=record):
+                with self.assertRaisesRegex(ValueError, r"questions\.txt:2: .*question"):
+                    self.read(f"First?\n{record}\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from graphrag.chunker import Chunk
+from graphrag.embedder import BagOfWordsEmbedder
+from graphrag.entity_extraction import extract_entities_and_relations
+from graphrag.graph_builder import build_graph
+from graphrag.retrieval import GraphRetriever
+
+TEXTS = [
+    "Alice met Bob in Paris to discuss knowledge graphs.",
+    "Bob explained retrieval over knowledge graphs to Carol.",
+    "Carol and Alice compared vector retrieval with graph retrieval.",
+    "Paris hosted a conference on graphs and retrieval.",
+    "Dave wrote about cooking pasta.",
+]
+QUESTIONS = ["knowledge graphs", "retrieval with vectors", "pasta", "unrelated words"]
+
+
+def make_retriever(texts=TEXTS):
+    chunks = [Chunk(chunk_id=f"doc::chunk-{i}", doc_id="doc", text=text) for i, text in enumerate(texts)]
+    extraction = extract_entities_and_relations(chunks)
+    graph = build_graph(chunks, extraction.entities, extraction.relations, extraction.mentions)
+    embedder = BagOfWordsEmbedder()
+    store = embedder.fit_transform_chunks(chunks)
+    return GraphRetriever(graph, {chunk.chunk_id: chunk for chunk in chunks}, embedder, store)
+
+
+def summary(results):
+    return [(r.chunk_id, round(r.score, 6), r.trail) for r in results]
+
+
+class RetrievalTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.retriever = make_retriever()
+
+    def test_no_duplicate_chunk_ids(self):
+        for question in QUESTIONS:
+            for k in (1, 2, len(TEXTS)):
+                ids = [result.chunk_id for result in self.retriever.query(question, k=k)]
+                self.assertEqual(len(ids), len(set(ids)), (question, k))
+
+    def test_results_sorted_best_first(self):
+        scores = [result.score for result in self.retriever.query("knowledge graphs", k=2)]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_graph_expansion_adds_neighbours(self):
+        results = self.retriever.query("met in Paris", k=1)
+        direct, *expanded = results
+        self.assertEqual(direct.trail, [direct.chunk_id])
+        self.assertTrue(expanded)
+        for result in expanded:
+            self.assertEqual(result.trail[0], direct.chunk_id)
+            self.assertEqual(result.trail[-1], result.chunk_id)
+            self.assertAlmostEqual(result.score, direct.score * 0.8, places=6)
+
+    def test_query_many_and_iter_query_match_query(self):
+        for k in (1, 3):
+            batched = self.retriever.query_many(QUESTIONS, k=k)
+            for question, batch_results in zip(QUESTIONS, batched):
+                expected = summary(self.retriever.query(question, k=k))
+                self.assertEqual(summary(batch_results), expected, (question, k))
+                self.assertEqual(summary(self.retriever.iter_query(question, k=k)), expected)
+
+    def test_non_positive_k_returns_nothing(self):
+        for k in (0, -1):
+            self.assertEqual(self.retriever.query("knowledge graphs", k=k), [])
+            self.assertEqual(list(self.retriever.iter_query("knowledge graphs", k=k)), [])
+            self.assertEqual(self.retriever.query_many(["knowledge graphs"], k=k), [[]])
+
+    def test_empty_batch(self):
+        self.assertEqual(self.retriever.query_many([], k=3), [])
+
+
+if __name__ == "__main__":
+    unittest.main()